@@ -1,31 +1,206 @@
+"""
+Problem Statement: 0/1 Knapsack
+
+Given n items with weights w[i] and values val[i] and a capacity C, pick a
+subset of the items with total weight at most C and the largest total
+value. Two dynamic programs solve it, each keeping a single row that is
+updated in place, item by item, from the high end down (so no item is
+used twice):
+
+- weight-indexed: best[c] = largest value with total weight at most c,
+  O(n * C) time and O(C) memory
+- value-indexed: min_weight[r] = smallest weight reaching value exactly
+  r; the answer is the largest r with min_weight[r] <= C. O(n * V) time
+  and O(V) memory for V = sum of the values, which is the choice when
+  the capacity is huge (up to W_MAX) but the values are small (summing
+  to about V_SUM_MAX)
+
+knapsack() runs whichever row is shorter. To recover the chosen items, one
+bit per (item, row cell) records whether the item improved that cell; the
+bits are walked back from the answer cell.
+
+Operations to implement:
+1. Weight-indexed and value-indexed DP
+2. Choosing between them by problem size
+3. Item reconstruction from the bitsets
+"""
+
+# Problem sizes the module is meant for: N_MAX items whose values sum to at
+# most V_SUM_MAX, with capacities up to W_MAX
 V_SUM_MAX = 1000
 N_MAX = 100
 W_MAX = 10000000
 
-dp = [[0 for i in range(N_MAX)] for i in range(V_SUM_MAX+1)]
-v = [[0 for i in range(N_MAX)] for i in range(V_SUM_MAX+1)]
+INF = float("inf")
 
-print(dp)
-print(v)
 
+def _check_items(weights, values):
+    if len(weights) != len(values):
+        raise ValueError("weights and values must have the same length")
+    if any(x < 0 for x in weights) or any(x < 0 for x in values):
+        raise ValueError("weights and values must be non-negative")
 
-def solve_dp(r, i, w, val, n):
-    pass
 
+def _new_bitset(size):
+    return bytearray((size + 7) // 8)
+
+
+def _walk_back(bitsets, cost, cell):
+    # Items whose bit is set at the current cell were taken there
+    taken = []
+    for i in range(len(bitsets) - 1, -1, -1):
+        if bitsets[i][cell >> 3] >> (cell & 7) & 1:
+            taken.append(i)
+            cell -= cost[i]
+    taken.reverse()
+    return taken
+
+
+def knapsack_by_weight(weights, values, capacity, reconstruct=False):
+    """
+    0/1 knapsack over a row indexed by weight, O(n * C)
+
+    Args:
+        weights (list): Non-negative int weights
+        values (list): Non-negative values
+        capacity (int or float): Maximum total weight
+        reconstruct (bool): Also return the chosen item indices
+
+    Returns:
+        The best total value, or (value, sorted item indices)
+    """
+    _check_items(weights, values)
+    if capacity < 0:
+        return (0, []) if reconstruct else 0
+    # Weights are ints, so a fractional capacity rounds down; capacity
+    # beyond the total weight is never used
+    capacity = min(int(capacity), sum(weights))
+
+    best = [0] * (capacity + 1)
+    bitsets = []
+    for w, v in zip(weights, values):
+        taken = _new_bitset(capacity + 1) if reconstruct else None
+        for c in range(capacity, w - 1, -1):
+            candidate = best[c - w] + v
+            if candidate > best[c]:
+                best[c] = candidate
+                if taken is not None:
+                    taken[c >> 3] |= 1 << (c & 7)
+        if reconstruct:
+            bitsets.append(taken)
+
+    # best[] is non-decreasing in c, so the full capacity holds the answer
+    if not reconstruct:
+        return best[capacity]
+    return best[capacity], _walk_back(bitsets, weights, capacity)
+
+
+def knapsack_by_value(weights, values, capacity, reconstruct=False):
+    """
+    0/1 knapsack over a row indexed by total value, O(n * V)
+
+    Args:
+        weights (list): Non-negative weights
+        values (list): Non-negative int values
+        capacity: Maximum total weight
+        reconstruct (bool): Also return the chosen item indices
+
+    Returns:
+        The best total value, or (value, sorted item indices)
+    """
+    _check_items(weights, values)
+    total = sum(values)
+
+    min_weight = [INF] * (total + 1)
+    min_weight[0] = 0
+    bitsets = []
+    for w, v in zip(weights, values):
+        taken = _new_bitset(total + 1) if reconstruct else None
+        for r in range(total, v - 1, -1):
+            candidate = min_weight[r - v] + w
+            if candidate < min_weight[r]:
+                min_weight[r] = candidate
+                if taken is not None:
+                    taken[r >> 3] |= 1 << (r & 7)
+        if reconstruct:
+            bitsets.append(taken)
+
+    best = max((r for r in range(total + 1) if min_weight[r] <= capacity), default=0)
+    if not reconstruct:
+        return best
+    if min_weight[best] > capacity:
+        # Even the empty selection does not fit a negative capacity
+        return 0, []
+    return best, _walk_back(bitsets, values, best)
+
+
+def choose_method(weights, values, capacity):
+    """
+    Pick "weight" or "value" for knapsack(): the DP with the shorter row,
+    among those whose row index is an int
+    """
+    weight_cells = min(max(capacity, 0), sum(weights)) + 1
+    value_cells = sum(values) + 1
+    by_weight = all(isinstance(x, int) for x in weights)
+    by_value = all(isinstance(x, int) for x in values)
+    if not (by_weight or by_value):
+        raise TypeError("either the weights or the values must all be ints")
+    if by_value and (not by_weight or value_cells < weight_cells):
+        return "value"
+    return "weight"
+
+
+def knapsack(weights, values, capacity, method=None, reconstruct=False):
+    """
+    Solve the 0/1 knapsack problem
+
+    Nothing is allocated until this is called; the row of the chosen DP is
+    the only table, plus one bit per row cell and item with reconstruct.
+
+    Args:
+        weights (list): Non-negative item weights
+        values (list): Non-negative item values
+        capacity: Maximum total weight
+        method (str, optional): "weight" or "value" (default: choose_method)
+        reconstruct (bool): Also return the chosen item indices
+
+    Returns:
+        The best total value, or (value, sorted item indices)
+    """
+    method = method or choose_method(weights, values, capacity)
+    if method == "weight":
+        return knapsack_by_weight(weights, values, capacity, reconstruct)
+    if method == "value":
+        return knapsack_by_value(weights, values, capacity, reconstruct)
+    raise ValueError(f"unknown knapsack method: {method!r}")
+
+
+def solve_dp(r, i, w, val, n):
+    """
+    Smallest total weight of a subset of items i..n-1 whose values sum to
+    exactly r (INF if there is none)
+    """
+    min_weight = [INF] * (r + 1)
+    min_weight[0] = 0
+    for j in range(i, n):
+        for s in range(r, val[j] - 1, -1):
+            candidate = min_weight[s - val[j]] + w[j]
+            if candidate < min_weight[s]:
+                min_weight[s] = candidate
+    return min_weight[r]
 
-def max_weight(w,val,n,C):
-    # Base cases
-    # for i in range(V_SUM_MAX, -1, -1):
-        # if solve_dp(i, 0, w, val, n) <= C):
-        #     return i
 
-    return 0
+def max_weight(w, val, n, C):
+    """Largest total value of the first n items that fits in capacity C"""
+    return knapsack(w[:n], val[:n], C)
 
 
 if __name__ == '__main__':
-    w = [3,4,5]
-    val=[30,50,60]
-    n=len(w)
-    C=8
+    w = [3, 4, 5]
+    val = [30, 50, 60]
+    n = len(w)
+    C = 8
 
-    print(max_weight(w,val,n,C))
\ No newline at end of file
+    print(max_weight(w, val, n, C))
+    print(knapsack(w, val, C, reconstruct=True))
+    print(knapsack([W_MAX // 2, W_MAX // 3, W_MAX // 4], val, W_MAX, reconstruct=True))
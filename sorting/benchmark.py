@@ -0,0 +1,216 @@
+"""
+Benchmark the sorting algorithms across sizes and input distributions
+
+For every algorithm, distribution and size the suite records:
+
+- wall time: best of --repeat runs on a fresh copy of the input
+- comparisons: one run over CountingKey wrappers, whose __lt__ counts calls
+- peak memory: one run under tracemalloc, above the input list itself
+
+The results are written as JSON, so two runs can be diffed to spot
+regressions between versions.
+
+Usage:
+    python -m sorting.benchmark [--max-size N] [--sizes N ...]
+        [--algorithms NAME ...] [--distributions NAME ...]
+        [--repeat R] [--seed S] [--output FILE]
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from sorting.merge_sort import merge_sort, natural_merge_sort
+from sorting.quick_sort import quick_sort
+from sorting.sort import sort
+
+# Largest size the suite accepts; the default run stops at DEFAULT_MAX_SIZE
+MAX_SIZE = 10 ** 7
+DEFAULT_MAX_SIZE = 10 ** 5
+
+
+class CountingKey:
+    """Wraps a value and counts every comparison made through __lt__"""
+
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        CountingKey.comparisons += 1
+        return self.value < other.value
+
+
+# name -> function(list) sorting the list in place
+ALGORITHMS = {
+    "sorted": lambda arr: arr.__setitem__(slice(None), sorted(arr)),
+    "merge_sort": merge_sort,
+    "natural_merge_sort": natural_merge_sort,
+    "quick_sort": quick_sort,
+    "sort": sort,
+}
+
+# Algorithms whose comparisons are counted; sort dispatches plain ints to
+# radix and counting sorts, so counting it through wrappers would mislead
+COMPARISON_SORTS = {"sorted", "merge_sort", "natural_merge_sort", "quick_sort"}
+
+
+def _random(rng, n):
+    return [rng.randrange(2 ** 31) for _ in range(n)]
+
+
+def _sorted(rng, n):
+    return sorted(_random(rng, n))
+
+
+def _reversed(rng, n):
+    return sorted(_random(rng, n), reverse=True)
+
+
+def _organ_pipe(rng, n):
+    half = n // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+def _few_unique(rng, n):
+    return [rng.randrange(10) for _ in range(n)]
+
+
+def _nearly_sorted(rng, n):
+    # Sorted, then about 1% of the elements swapped with a random partner
+    arr = _sorted(rng, n)
+    for _ in range(max(n // 100, 1) if n > 1 else 0):
+        i, j = rng.randrange(n), rng.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+# name -> function(random.Random, n) returning the input list
+DISTRIBUTIONS = {
+    "random": _random,
+    "sorted": _sorted,
+    "reversed": _reversed,
+    "organ_pipe": _organ_pipe,
+    "few_unique": _few_unique,
+    "nearly_sorted": _nearly_sorted,
+}
+
+
+def default_sizes(max_size=DEFAULT_MAX_SIZE):
+    """Powers of ten from 10 up to max_size"""
+    sizes = []
+    size = 10
+    while size <= max_size:
+        sizes.append(size)
+        size *= 10
+    return sizes
+
+
+def measure(algorithm, data, repeat=3, count_comparisons=True):
+    """
+    Measure one algorithm on one input
+
+    Args:
+        algorithm (callable): Sorts a list in place
+        data (list): The input, left unchanged
+        repeat (int): Timed runs, of which the fastest is reported
+        count_comparisons (bool): Also run over CountingKey wrappers
+
+    Returns:
+        dict: time_s, comparisons (None if not counted) and peak_memory_bytes
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        arr = data[:]
+        start = time.perf_counter()
+        algorithm(arr)
+        best = min(best, time.perf_counter() - start)
+
+    comparisons = None
+    if count_comparisons:
+        wrapped = [CountingKey(x) for x in data]
+        CountingKey.comparisons = 0
+        algorithm(wrapped)
+        comparisons = CountingKey.comparisons
+        del wrapped
+
+    arr = data[:]
+    tracemalloc.start()
+    try:
+        algorithm(arr)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"time_s": best, "comparisons": comparisons, "peak_memory_bytes": peak}
+
+
+def run(algorithms, distributions, sizes, repeat=3, seed=0, log=None):
+    """
+    Run every combination of algorithm, distribution and size
+
+    Every input is generated from a seed derived from (seed, distribution,
+    size), so it is the same across runs and versions.
+
+    Returns:
+        dict: Environment details and one result record per combination
+    """
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            data = DISTRIBUTIONS[distribution](random.Random(f"{seed}-{distribution}-{size}"), size)
+            for name in algorithms:
+                record = {"algorithm": name, "distribution": distribution, "size": size}
+                record.update(measure(ALGORITHMS[name], data, repeat, name in COMPARISON_SORTS))
+                results.append(record)
+                if log:
+                    log(record)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sorting.benchmark", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE,
+                        help=f"largest power-of-ten size, at most {MAX_SIZE:,} (default {DEFAULT_MAX_SIZE:,})")
+    parser.add_argument("--sizes", type=int, nargs="+", help="explicit sizes, overriding --max-size")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or default_sizes(args.max_size)
+    if any(size < 0 or size > MAX_SIZE for size in sizes):
+        parser.error(f"sizes must be between 0 and {MAX_SIZE:,}")
+
+    def log(record):
+        print(f"{record['algorithm']:>18s} {record['distribution']:>13s} {record['size']:>9,d}: "
+              f"{record['time_s']:9.4f} s {record['comparisons'] or 0:>12,d} cmp "
+              f"{record['peak_memory_bytes'] / 2 ** 20:8.2f} MB", file=sys.stderr)
+
+    report = run(args.algorithms, args.distributions, sizes, args.repeat, args.seed, log)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
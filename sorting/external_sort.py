@@ -0,0 +1,213 @@
+"""
+Problem Statement: Sort Data Larger Than Memory
+
+merge_sort and quick_sort need the whole list in memory. An external merge
+sort only ever holds a bounded part of it:
+
+- run generation: records are streamed in and buffered until the memory
+  budget is reached, then the buffer is sorted and spilled to a temporary
+  file as one sorted run
+- merge: the runs are streamed back with small read buffers and merged
+  with heapq.merge, which keeps one record per run in a heap. If there are
+  more runs than the fan-in allows, groups of runs are first merged into
+  longer runs, pass by pass
+
+Runs are stored either as text, one record per line, or as the raw machine
+values of an array typecode such as 'q' or 'd'. Earlier runs come first in
+every merge, so the sort is stable.
+
+Operations to implement:
+1. Stream records into memory-bounded sorted runs
+2. Spill runs in a line or binary format
+3. Merge the runs k ways, in several passes if needed
+
+Applications:
+- Sorting log files and CSV exports larger than RAM
+- Building sorted inputs for merge joins and index builds
+"""
+
+import heapq
+import os
+import sys
+import tempfile
+from array import array
+from itertools import islice
+
+# Default memory budget for buffered records and read buffers, in bytes
+MEMORY_LIMIT = 64 * 2 ** 20
+
+# Default number of runs merged at once
+FAN_IN = 64
+
+# Bytes taken by one list slot on top of the record itself
+_SLOT_SIZE = 8
+
+
+class LineFormat:
+    """Runs stored as text, one str record per line"""
+
+    def __init__(self, encoding="utf-8"):
+        self.encoding = encoding
+
+    def write(self, path, records, buffer_size):
+        with open(path, "w", encoding=self.encoding, newline="\n", buffering=buffer_size) as f:
+            f.writelines(record + "\n" for record in records)
+
+    def read(self, path, buffer_size):
+        with open(path, encoding=self.encoding, newline="\n", buffering=buffer_size) as f:
+            for line in f:
+                yield line[:-1] if line.endswith("\n") else line
+
+
+class ArrayFormat:
+    """Runs stored as the raw machine values of an array typecode"""
+
+    def __init__(self, typecode):
+        self.typecode = typecode
+        self.itemsize = array(typecode).itemsize
+
+    def write(self, path, records, buffer_size):
+        count = max(buffer_size // self.itemsize, 1)
+        records = iter(records)
+        with open(path, "wb") as f:
+            while True:
+                chunk = array(self.typecode, islice(records, count))
+                if not chunk:
+                    break
+                chunk.tofile(f)
+
+    def read(self, path, buffer_size):
+        count = max(buffer_size // self.itemsize, 1)
+        with open(path, "rb") as f:
+            while True:
+                chunk = array(self.typecode)
+                try:
+                    chunk.fromfile(f, count)
+                except EOFError:
+                    # Raised on a short last chunk, after reading what is left
+                    pass
+                if not chunk:
+                    break
+                yield from chunk
+
+
+def _get_format(typecode):
+    return LineFormat() if typecode is None else ArrayFormat(typecode)
+
+
+def _sorted_runs(records, key, reverse, memory_limit):
+    """
+    Split records into sorted lists taking about memory_limit bytes each
+
+    Yields:
+        tuple: (sorted list, whether more records follow)
+    """
+    run = []
+    size = 0
+    for record in records:
+        if size >= memory_limit:
+            run.sort(key=key, reverse=reverse)
+            yield run, True
+            run = []
+            size = 0
+        run.append(record)
+        size += sys.getsizeof(record) + _SLOT_SIZE
+    run.sort(key=key, reverse=reverse)
+    yield run, False
+
+
+def external_sort(records, key=None, reverse=False, typecode=None,
+                  memory_limit=MEMORY_LIMIT, fan_in=FAN_IN, tmp_dir=None):
+    """
+    Sort an iterable of records that may not fit in memory
+
+    Args:
+        records (iterable): The records to sort, consumed once
+        key (callable, optional): Function computing the sort key of a record
+        reverse (bool): Sort in descending order (still stable)
+        typecode (str, optional): Spill runs as array values of this
+            typecode; by default runs are text and records must be str
+            without newlines
+        memory_limit (int): Bytes of records buffered per run; the merge
+            read buffers share the same budget. Objects created by key
+            are not counted.
+        fan_in (int): Maximum number of runs merged at once (at least 2)
+        tmp_dir (str, optional): Directory for the run files
+
+    Yields:
+        The records in sorted order. The run files are removed once the
+        generator is exhausted or closed.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    run_format = _get_format(typecode)
+    runs = _sorted_runs(records, key, reverse, memory_limit)
+    run, more = next(runs)
+    if not more:
+        # Everything fit in one run: nothing to spill
+        yield from run
+        return
+
+    buffer_size = max(memory_limit // (2 * (fan_in + 1)), 4096)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        counter = 0
+
+        def spill(sorted_records):
+            nonlocal counter
+            path = os.path.join(directory, f"run{counter}")
+            counter += 1
+            run_format.write(path, sorted_records, buffer_size)
+            return path
+
+        def merged(paths):
+            readers = [run_format.read(path, buffer_size) for path in paths]
+            return heapq.merge(*readers, key=key, reverse=reverse)
+
+        paths = [spill(run)]
+        # Drop each run before the next one is buffered
+        del run
+        for run, _ in runs:
+            paths.append(spill(run))
+            del run
+
+        while len(paths) > fan_in:
+            next_paths = []
+            for i in range(0, len(paths), fan_in):
+                group = paths[i:i + fan_in]
+                if len(group) == 1:
+                    next_paths.append(group[0])
+                    continue
+                next_paths.append(spill(merged(group)))
+                for path in group:
+                    os.remove(path)
+            paths = next_paths
+
+        yield from merged(paths)
+
+
+def sort_file(input_path, output_path, key=None, reverse=False, typecode=None,
+              memory_limit=MEMORY_LIMIT, fan_in=FAN_IN, tmp_dir=None):
+    """
+    Sort a file that may not fit in memory into another file
+
+    By default the file is read as text and every line is a record; with a
+    typecode it is read as the raw machine values of that array typecode.
+    The remaining arguments are those of external_sort.
+    """
+    file_format = _get_format(typecode)
+    buffer_size = max(memory_limit // (2 * (fan_in + 1)), 4096)
+    records = file_format.read(input_path, buffer_size)
+    file_format.write(output_path, external_sort(
+        records, key=key, reverse=reverse, typecode=typecode,
+        memory_limit=memory_limit, fan_in=fan_in, tmp_dir=tmp_dir,
+    ), buffer_size)
+
+
+if __name__ == "__main__":
+    import random
+
+    data = [f"{random.randint(0, 10 ** 6):07d}" for _ in range(100_000)]
+    result = list(external_sort(data, memory_limit=2 ** 20, fan_in=4))
+    print(result == sorted(data), result[:5])
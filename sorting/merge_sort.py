@@ -1,3 +1,6 @@
+import operator
+
+
 def merge_sort(arr):
     if len(arr) > 1:
         mid = len(arr)//2
@@ -28,10 +31,206 @@ def merge_sort(arr):
             k += 1
 
 
+# Runs shorter than this are extended with binary insertion sort
+MIN_RUN = 32
+
+# Consecutive wins by one side before a merge switches to galloping
+MIN_GALLOP = 7
+
+
+def _gallop(seq, lo, hi, pred):
+    """
+    Exponential + binary search in a sorted run: the first index in
+    [lo, hi) where pred is false, given pred is true up to some point
+    """
+    step = 1
+    bound = lo
+    while bound < hi and pred(seq[bound]):
+        lo = bound + 1
+        bound = lo + step
+        step *= 2
+    hi = min(bound, hi)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if pred(seq[mid]):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _find_runs(keys, values, lt):
+    """
+    Split keys into ascending runs, reversing strictly descending ones and
+    extending short ones to MIN_RUN with binary insertion sort
+
+    Returns the run boundaries [0, end_1, ..., len(keys)]
+    """
+    n = len(keys)
+    bounds = [0]
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and lt(keys[j], keys[i]):
+            # Strictly descending, so reversing it keeps the sort stable
+            while j < n and lt(keys[j], keys[j - 1]):
+                j += 1
+            lo, hi = i, j - 1
+            while lo < hi:
+                keys[lo], keys[hi] = keys[hi], keys[lo]
+                if values is not None:
+                    values[lo], values[hi] = values[hi], values[lo]
+                lo += 1
+                hi -= 1
+        else:
+            while j < n and not lt(keys[j], keys[j - 1]):
+                j += 1
+
+        end = min(n, i + MIN_RUN)
+        for p in range(j, end):
+            x = keys[p]
+            lo, hi = i, p
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if lt(x, keys[mid]):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            if lo < p:
+                keys[lo + 1:p + 1] = keys[lo:p]
+                keys[lo] = x
+                if values is not None:
+                    v = values[p]
+                    values[lo + 1:p + 1] = values[lo:p]
+                    values[lo] = v
+        j = max(j, end)
+
+        bounds.append(j)
+        i = j
+    return bounds
+
+
+def _merge(src_keys, src_values, dst_keys, dst_values, lo, mid, hi, lt):
+    """Stably merge the runs [lo, mid) and [mid, hi) of src into dst"""
+    if not lt(src_keys[mid], src_keys[mid - 1]):
+        # Already in order
+        dst_keys[lo:hi] = src_keys[lo:hi]
+        if src_values is not None:
+            dst_values[lo:hi] = src_values[lo:hi]
+        return
+
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+
+    while i < mid and j < hi:
+        if lt(src_keys[j], src_keys[i]):
+            dst_keys[k] = src_keys[j]
+            if src_values is not None:
+                dst_values[k] = src_values[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+
+            if right_wins >= MIN_GALLOP:
+                # Copy every right element that still comes before the left head
+                pivot = src_keys[i]
+                end = _gallop(src_keys, j, hi, lambda x: lt(x, pivot))
+                dst_keys[k:k + end - j] = src_keys[j:end]
+                if src_values is not None:
+                    dst_values[k:k + end - j] = src_values[j:end]
+                k += end - j
+                j = end
+                right_wins = 0
+        else:
+            dst_keys[k] = src_keys[i]
+            if src_values is not None:
+                dst_values[k] = src_values[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+
+            if left_wins >= MIN_GALLOP:
+                # Copy every left element that does not come after the right head
+                pivot = src_keys[j]
+                end = _gallop(src_keys, i, mid, lambda x: not lt(pivot, x))
+                dst_keys[k:k + end - i] = src_keys[i:end]
+                if src_values is not None:
+                    dst_values[k:k + end - i] = src_values[i:end]
+                k += end - i
+                i = end
+                left_wins = 0
+
+    dst_keys[k:k + mid - i] = src_keys[i:mid]
+    dst_keys[k + mid - i:hi] = src_keys[j:hi]
+    if src_values is not None:
+        dst_values[k:k + mid - i] = src_values[i:mid]
+        dst_values[k + mid - i:hi] = src_values[j:hi]
+
+
+def natural_merge_sort(arr, key=None, reverse=False):
+    """
+    Stable, iterative (bottom-up) natural merge sort, in place
 
+    Existing ascending and descending runs are detected first, then
+    adjacent runs are merged pass by pass, ping-ponging between lists that
+    are allocated once instead of at every level. Without key that is one
+    auxiliary list of n slots. With key, key is called once per element and
+    the keys are merged alongside the elements, which takes three: the
+    list of keys, a buffer for it and a buffer for the elements.
+    reverse keeps equal elements in their original order, like sorted().
+    :param arr: list to sort
+    :param key: optional function computing the sort key of an element
+    :param reverse: sort in descending order
+    """
+    n = len(arr)
+    if n < 2:
+        return
+
+    lt = operator.gt if reverse else operator.lt
+    keys = arr if key is None else [key(x) for x in arr]
+    values = None if key is None else arr
+
+    bounds = _find_runs(keys, values, lt)
+    if len(bounds) == 2:
+        # A single run, already sorted in place
+        return
+
+    # Start from a copy when the pass count is odd, so the last pass
+    # writes into arr and no copy back is needed
+    odd_passes = (len(bounds) - 2).bit_length() % 2
+    if values is None:
+        src_keys, dst_keys = (arr[:], arr) if odd_passes else (arr, [None] * n)
+        src_values = dst_values = None
+    else:
+        src_keys, dst_keys = keys, [None] * n
+        src_values, dst_values = (arr[:], arr) if odd_passes else (arr, [None] * n)
+
+    while len(bounds) > 2:
+        merged = [0]
+        for r in range(0, len(bounds) - 1, 2):
+            lo, mid = bounds[r], bounds[r + 1]
+            if r + 2 < len(bounds):
+                hi = bounds[r + 2]
+                _merge(src_keys, src_values, dst_keys, dst_values, lo, mid, hi, lt)
+            else:
+                # Odd run out: carry it over to the next pass
+                hi = mid
+                dst_keys[lo:hi] = src_keys[lo:hi]
+                if src_values is not None:
+                    dst_values[lo:hi] = src_values[lo:hi]
+            merged.append(hi)
+        bounds = merged
+        src_keys, dst_keys = dst_keys, src_keys
+        src_values, dst_values = dst_values, src_values
 
 
 if __name__ == '__main__':
     arr = [10, 50, 60, 40, 30, 20, 70, 90, 80, 0, 1, 50, 30]
     merge_sort(arr)
-    print(arr)
\ No newline at end of file
+    print(arr)
+
+    arr = [10, 50, 60, 40, 30, 20, 70, 90, 80, 0, 1, 50, 30]
+    natural_merge_sort(arr, reverse=True)
+    print(arr)
@@ -0,0 +1,219 @@
+"""
+Problem Statement: Sort Large Numeric Arrays on Many Cores
+
+merge_sort and quick_sort run on one core. A numeric array can be sorted
+in two parallel phases:
+
+- sort: the array is cut into one partition per worker and every
+  partition is sorted independently
+- merge: splitter values sampled from the sorted partitions cut every
+  partition into the same number of value ranges; range j of all
+  partitions is merged by one worker and written at the offset given by
+  the sizes of the ranges before it, so the merges are independent too
+
+Nothing is pickled per element. The values are copied once into a
+multiprocessing.shared_memory block as machine integers or doubles (array
+typecodes 'q' and 'd'), the merged output goes to a second block, and each
+task only carries names and offsets.
+
+Operations to implement:
+1. Copy the values into shared memory
+2. Sort the partitions in a process pool
+3. Pick splitters and merge the value ranges in a process pool
+
+Applications:
+- Batch jobs sorting 10^8 ints or floats
+- Building sorted columns and indexes
+"""
+
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Arrays shorter than this are sorted in-process, as the pool costs more
+PARALLEL_MIN_SIZE = 100_000
+
+# Samples taken from each sorted partition to choose the splitters
+SAMPLES_PER_PARTITION = 64
+
+
+def _attach(name, typecode, length):
+    block = shared_memory.SharedMemory(name=name)
+    return block, block.buf[:length * array(typecode).itemsize].cast(typecode)
+
+
+def _sort_partition(task):
+    """
+    Sort one partition of the input block in place (runs in a worker)
+
+    Args:
+        task (tuple): (block name, typecode, length, start, end)
+    """
+    name, typecode, length, start, end = task
+    block, values = _attach(name, typecode, length)
+    try:
+        part = values[start:end]
+        items = part.tolist()
+        items.sort()
+        part[:] = array(typecode, items)
+        part.release()
+    finally:
+        values.release()
+        block.close()
+
+
+def _merge_range(task):
+    """
+    Merge one value range of all sorted partitions into the output block
+    (runs in a worker)
+
+    Args:
+        task (tuple): (input block name, output block name, typecode,
+            length, [(start, end) per partition], output offset)
+    """
+    src_name, dst_name, typecode, length, segments, offset = task
+    src_block, src = _attach(src_name, typecode, length)
+    dst_block, dst = _attach(dst_name, typecode, length)
+    try:
+        items = []
+        for start, end in segments:
+            items.extend(src[start:end].tolist())
+        # The segments are sorted runs, which list.sort finds and merges in
+        # C, much faster than an element-by-element heapq.merge
+        items.sort()
+        dst[offset:offset + len(items)] = array(typecode, items)
+    finally:
+        src.release()
+        dst.release()
+        src_block.close()
+        dst_block.close()
+
+
+def _splitters(values, bounds, count):
+    """
+    Choose count - 1 splitter values from evenly spaced samples of the
+    sorted partitions
+    """
+    samples = []
+    for start, end in bounds:
+        step = max((end - start) // SAMPLES_PER_PARTITION, 1)
+        samples.extend(values[i] for i in range(start, end, step))
+    samples.sort()
+    return [samples[len(samples) * j // count] for j in range(1, count)]
+
+
+def _merge_tasks(values, bounds, src_name, dst_name, typecode, workers):
+    """Cut every partition at the splitters into one merge task per range"""
+    splitters = _splitters(values, bounds, workers)
+
+    # cuts[i] holds the range boundaries inside partition i
+    cuts = []
+    for start, end in bounds:
+        cuts.append([start] + [bisect_left(values, s, start, end) for s in splitters] + [end])
+
+    tasks = []
+    offset = 0
+    for j in range(workers):
+        segments = [(cut[j], cut[j + 1]) for cut in cuts if cut[j] < cut[j + 1]]
+        size = sum(end - start for start, end in segments)
+        if size:
+            tasks.append((src_name, dst_name, typecode, len(values), segments, offset))
+        offset += size
+    return tasks
+
+
+def _run(tasks, function, executor):
+    if executor is None:
+        for task in tasks:
+            function(task)
+    else:
+        for _ in executor.map(function, tasks):
+            pass
+
+
+def _as_array(data):
+    if isinstance(data, array):
+        return data
+    data = list(data)
+    typecode = "q" if all(isinstance(x, int) for x in data) else "d"
+    return array(typecode, data)
+
+
+def parallel_merge_sort(data, workers=None):
+    """
+    Sort a numeric array with a process pool over shared memory
+
+    Args:
+        data (array or iterable): Numbers to sort. An array keeps its
+            typecode; other iterables become array('q') if every value is
+            an int and array('d') otherwise.
+        workers (int, optional): Number of processes (default: CPU count).
+            With 1 worker, or fewer than PARALLEL_MIN_SIZE values, both
+            phases run in this process.
+
+    Returns:
+        array: The sorted values
+    """
+    workers = workers or os.cpu_count() or 1
+    values = _as_array(data)
+    typecode, n = values.typecode, len(values)
+    if n == 0:
+        return array(typecode)
+
+    nbytes = n * values.itemsize
+    src_block = shared_memory.SharedMemory(create=True, size=nbytes)
+    dst_block = shared_memory.SharedMemory(create=True, size=nbytes)
+    src = src_block.buf[:nbytes].cast(typecode)
+    try:
+        src[:] = values
+
+        parts = min(workers, n)
+        bounds = [(n * i // parts, n * (i + 1) // parts) for i in range(parts)]
+        sort_tasks = [(src_block.name, typecode, n, start, end) for start, end in bounds]
+
+        executor = None
+        if workers > 1 and n >= PARALLEL_MIN_SIZE:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            _run(sort_tasks, _sort_partition, executor)
+            merge_tasks = _merge_tasks(src, bounds, src_block.name, dst_block.name, typecode, parts)
+            _run(merge_tasks, _merge_range, executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        result = array(typecode)
+        result.frombytes(dst_block.buf[:nbytes])
+        return result
+    finally:
+        src.release()
+        for block in (src_block, dst_block):
+            block.close()
+            block.unlink()
+
+
+# Benchmark: python -m sorting.parallel_merge_sort [count in millions]
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    n = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 2_000_000
+    cpus = os.cpu_count() or 1
+
+    random.seed(0)
+    for typecode, make in (("q", lambda: random.getrandbits(62)), ("d", random.random)):
+        data = array(typecode, (make() for _ in range(n)))
+        expected = sorted(data)
+
+        print(f"array('{typecode}'): {n:,} values, {cpus} CPUs")
+        baseline = None
+        for workers in sorted({1, 2, 4, cpus}):
+            start = time.perf_counter()
+            result = parallel_merge_sort(data, workers=workers)
+            elapsed = time.perf_counter() - start
+            assert result.tolist() == expected
+            baseline = baseline or elapsed
+            print(f"workers={workers:2d}: {elapsed:7.3f} s, speedup {baseline / elapsed:4.2f}x")
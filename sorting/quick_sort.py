@@ -16,11 +16,130 @@ def partition(arr, low, high):
     return low
 
 
-def quick_sort(arr, lb, ub):
+# Ranges up to this size are finished with insertion sort
+INSERTION_SORT_THRESHOLD = 16
+
+# Ranges from this size up pick the pivot with Tukey's ninther
+NINTHER_THRESHOLD = 40
+
+
+def insertion_sort(arr, lb, ub):
+    for i in range(lb + 1, ub + 1):
+        item = arr[i]
+        j = i - 1
+        while j >= lb and item < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = item
+
+
+def _median_of_three(arr, a, b, c):
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def choose_pivot(arr, lb, ub):
+    """
+    Index of a pivot for arr[lb..ub]: the median of the first, middle and
+    last elements, or for large ranges the median of three such medians
+    """
+    mid = (lb + ub) // 2
+    if ub - lb + 1 < NINTHER_THRESHOLD:
+        return _median_of_three(arr, lb, mid, ub)
+    step = (ub - lb + 1) // 8
+    return _median_of_three(
+        arr,
+        _median_of_three(arr, lb, lb + step, lb + 2 * step),
+        _median_of_three(arr, mid - step, mid, mid + step),
+        _median_of_three(arr, ub - 2 * step, ub - step, ub),
+    )
+
+
+def partition3(arr, lb, ub, pivot):
+    """
+    Dutch national flag partition of arr[lb..ub] around arr[pivot]
+
+    Returns (lt, gt) such that arr[lb..lt-1] < p, arr[lt..gt] == p and
+    arr[gt+1..ub] > p, so runs of equal keys are never partitioned again
+    """
+    value = arr[pivot]
+    lt, i, gt = lb, lb, ub
+    while i <= gt:
+        if arr[i] < value:
+            swap(arr, i, lt)
+            lt += 1
+            i += 1
+        elif value < arr[i]:
+            swap(arr, i, gt)
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _sift_down(arr, lb, root, end):
+    # Max-heap over arr[lb..end], with node k stored at arr[lb + k]
+    item = arr[lb + root]
+    child = 2 * root + 1
+    while child <= end - lb:
+        if child < end - lb and arr[lb + child] < arr[lb + child + 1]:
+            child += 1
+        if not item < arr[lb + child]:
+            break
+        arr[lb + root] = arr[lb + child]
+        root = child
+        child = 2 * root + 1
+    arr[lb + root] = item
+
+
+def heap_sort(arr, lb, ub):
+    n = ub - lb + 1
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lb, root, ub)
+    for end in range(ub, lb, -1):
+        swap(arr, lb, end)
+        _sift_down(arr, lb, 0, end - 1)
+
+
+def _introsort(arr, lb, ub, depth):
+    while ub - lb + 1 > INSERTION_SORT_THRESHOLD:
+        if depth == 0:
+            heap_sort(arr, lb, ub)
+            return
+        depth -= 1
+
+        lt, gt = partition3(arr, lb, ub, choose_pivot(arr, lb, ub))
+
+        # Recurse into the smaller side and loop on the larger one, so the
+        # stack never grows past log n frames
+        if lt - lb < ub - gt:
+            _introsort(arr, lb, lt - 1, depth)
+            lb = gt + 1
+        else:
+            _introsort(arr, gt + 1, ub, depth)
+            ub = lt - 1
+
+    insertion_sort(arr, lb, ub)
+
+
+def quick_sort(arr, lb=0, ub=None):
+    """
+    Sort arr[lb..ub] (inclusive) in place with introsort
+
+    Quick sort with median-of-three / ninther pivots and three-way
+    partitioning, finishing small ranges with insertion sort and falling
+    back to heap sort past 2*log2(n) levels, so the worst case stays
+    O(n log n). Not stable.
+    """
+    if ub is None:
+        ub = len(arr) - 1
     if lb < ub:
-        pivot = partition(arr, lb, ub)
-        quick_sort(arr, 0, pivot)
-        quick_sort(arr, pivot + 1, ub)
+        _introsort(arr, lb, ub, 2 * (ub - lb + 1).bit_length())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,229 @@
+"""
+Problem Statement: Linear-Time Sorting of Integer and Byte String Keys
+
+Comparison sorts need O(n log n) comparisons. Keys that are small integers
+or fixed-width digit strings can be sorted by distribution instead:
+
+- counting sort: count how often every key in [lo, hi] occurs and place
+  each item at the prefix sum of its key, O(n + hi - lo)
+- LSD radix sort: stable distribution passes over the digits of the keys,
+  least significant first, O(n * digits). Negative ints are shifted by the
+  minimum key so every key becomes non-negative
+- fixed-length bytes are radix sorted one byte position at a time, from
+  the last position to the first
+
+All sorts are stable and work in place on lists. When NumPy is installed,
+large inputs use vectorized passes instead: bincount/repeat for counting
+sort, a stable argsort per 16 bit digit for radix sort (NumPy runs it as
+a radix sort itself; plain ints, whose order needs no stability, go
+straight to numpy.sort) and lexsort over the byte columns for bytes.
+
+Operations to implement:
+1. Counting sort for keys in a small range
+2. LSD radix sort for ints, including negative values
+3. LSD radix sort for fixed-length byte strings
+"""
+
+from itertools import chain, repeat
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Bits per digit of the pure Python radix sort (one bucket per digit value)
+RADIX_BITS = 8
+
+# Bits per digit of the NumPy radix sort
+NUMPY_RADIX_BITS = 16
+
+# Inputs from this size use NumPy when it is installed
+NUMPY_MIN_SIZE = 2000
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def _get_keys(arr, key):
+    return arr if key is None else [key(item) for item in arr]
+
+
+def _use_numpy(n, lo, hi):
+    return numpy is not None and n >= NUMPY_MIN_SIZE and INT64_MIN <= lo and hi <= INT64_MAX
+
+
+def _counting_sort(arr, keys, lo, hi, key):
+    n = len(arr)
+    if _use_numpy(n, lo, hi):
+        np_keys = numpy.fromiter(keys, dtype=numpy.int64, count=n) - lo
+        if key is None:
+            counts = numpy.bincount(np_keys, minlength=hi - lo + 1)
+            arr[:] = numpy.repeat(numpy.arange(lo, hi + 1, dtype=numpy.int64), counts).tolist()
+        else:
+            arr[:] = [arr[i] for i in numpy.argsort(np_keys, kind="stable").tolist()]
+        return
+
+    counts = [0] * (hi - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+
+    if key is None:
+        # Equal ints are interchangeable, so the output is rebuilt from counts
+        arr[:] = chain.from_iterable(repeat(lo + k, c) for k, c in enumerate(counts) if c)
+        return
+
+    # Turn the counts into the first output position of every key
+    total = 0
+    for k, c in enumerate(counts):
+        counts[k] = total
+        total += c
+
+    result = [None] * n
+    for item, k in zip(arr, keys):
+        result[counts[k - lo]] = item
+        counts[k - lo] += 1
+    arr[:] = result
+
+
+def counting_sort(arr, key=None, lo=None, hi=None):
+    """
+    Stable counting sort of a list in place by int keys, O(n + hi - lo)
+
+    Args:
+        arr (list): Items to sort; ints if key is None
+        key (callable, optional): Function computing an int key per item
+        lo (int, optional): Smallest key (default: computed)
+        hi (int, optional): Largest key (default: computed)
+
+    Raises:
+        ValueError: If a key falls outside [lo, hi]
+    """
+    if len(arr) < 2:
+        return
+    keys = _get_keys(arr, key)
+    smallest, largest = min(keys), max(keys)
+    lo = smallest if lo is None else lo
+    hi = largest if hi is None else hi
+    if smallest < lo or largest > hi:
+        raise ValueError(f"counting_sort keys span [{smallest}, {largest}], outside [{lo}, {hi}]")
+    _counting_sort(arr, keys, lo, hi, key)
+
+
+def _radix_sort(arr, keys, lo, hi, key):
+    n = len(arr)
+    bits = (hi - lo).bit_length()
+    if bits == 0:
+        # All keys are equal
+        return
+
+    if _use_numpy(n, lo, hi):
+        np_keys = numpy.fromiter(keys, dtype=numpy.int64, count=n)
+        if key is None:
+            # Equal ints are interchangeable, so any vectorized sort will do
+            np_keys.sort()
+            arr[:] = np_keys.tolist()
+            return
+
+        # k - lo computed modulo 2^64 is exact and keeps negative keys in order
+        np_keys = np_keys.view(numpy.uint64)
+        np_keys -= numpy.uint64(lo % 2 ** 64)
+        mask = numpy.uint64((1 << NUMPY_RADIX_BITS) - 1)
+        order = numpy.arange(n)
+        for shift in range(0, bits, NUMPY_RADIX_BITS):
+            digits = ((np_keys[order] >> numpy.uint64(shift)) & mask).astype(numpy.uint16)
+            order = order[numpy.argsort(digits, kind="stable")]
+        arr[:] = [arr[i] for i in order.tolist()]
+        return
+
+    shifted = [k - lo for k in keys]
+    mask = (1 << RADIX_BITS) - 1
+    order = range(n)
+    for shift in range(0, bits, RADIX_BITS):
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[(shifted[i] >> shift) & mask].append(i)
+        order = list(chain.from_iterable(buckets))
+    arr[:] = [arr[i] for i in order]
+
+
+def radix_sort(arr, key=None):
+    """
+    Stable LSD radix sort of a list in place by int keys, negative or not
+
+    Takes O(n * b / RADIX_BITS) for keys spanning b bits.
+
+    Args:
+        arr (list): Items to sort; ints if key is None
+        key (callable, optional): Function computing an int key per item
+    """
+    if len(arr) < 2:
+        return
+    keys = _get_keys(arr, key)
+    _radix_sort(arr, keys, min(keys), max(keys), key)
+
+
+def _radix_sort_bytes(arr, keys, width):
+    n = len(arr)
+    if width == 0:
+        return
+
+    if numpy is not None and n >= NUMPY_MIN_SIZE:
+        matrix = numpy.frombuffer(b"".join(keys), dtype=numpy.uint8).reshape(n, width)
+        # lexsort is a stable sort by the last row first, so passing the
+        # byte columns in reverse is an LSD pass per byte position
+        order = numpy.lexsort(matrix.T[::-1])
+        arr[:] = [arr[i] for i in order.tolist()]
+        return
+
+    order = range(n)
+    for column in range(width - 1, -1, -1):
+        buckets = [[] for _ in range(256)]
+        for i in order:
+            buckets[keys[i][column]].append(i)
+        order = list(chain.from_iterable(buckets))
+    arr[:] = [arr[i] for i in order]
+
+
+def radix_sort_bytes(arr, key=None):
+    """
+    Stable LSD radix sort of a list in place by fixed-length bytes keys
+
+    Takes O(n * width), one distribution pass per byte position.
+
+    Args:
+        arr (list): Items to sort; bytes if key is None
+        key (callable, optional): Function computing a bytes key per item
+
+    Raises:
+        ValueError: If the keys do not all have the same length
+    """
+    if len(arr) < 2:
+        return
+    keys = _get_keys(arr, key)
+    width = len(keys[0])
+    if any(len(k) != width for k in keys):
+        raise ValueError("radix_sort_bytes needs keys of equal length")
+    _radix_sort_bytes(arr, keys, width)
+
+
+if __name__ == "__main__":
+    arr = [5, -1, 9, 3, 3, 0]
+    counting_sort(arr)
+    print(arr)
+
+    arr = [170, -45, 75, -90, 802, 24, 2, 66]
+    radix_sort(arr)
+    print(arr)
+
+    arr = [b"cab", b"abc", b"bca", b"abb"]
+    radix_sort_bytes(arr)
+    print(arr)
+
+    # Keys outside an explicit range are rejected, never silently dropped
+    for lo, hi in ((2, 9), (0, 5)):
+        try:
+            counting_sort([5, 1, 9, 3], lo=lo, hi=hi)
+        except ValueError as error:
+            print(f"lo={lo}, hi={hi}: {error}")
+        else:
+            raise AssertionError("out-of-range keys were accepted")
@@ -0,0 +1,146 @@
+"""
+Problem Statement: Select Without Sorting
+
+Finding the median or the largest k items does not need a full sort:
+
+- nth_element: introselect. Quickselect partitions around a median-of-three
+  or ninther pivot (partition3 from quick_sort) and continues on the side
+  holding index n only, O(n) on average. Past 2*log2(n) rounds it switches
+  to median-of-medians pivots, which bound the worst case to O(n)
+- partial_sort: nth_element to bring the k smallest to the front, then
+  quick_sort on those k only, O(n + k log k)
+- top_k: a min-heap of the k largest items seen so far, for streams that
+  cannot be held in memory, O(n log k) time and O(k) memory
+
+Operations to implement:
+1. nth_element(arr, n)
+2. partial_sort(arr, k)
+3. top_k(iterable, k, key=None)
+"""
+
+import heapq
+from itertools import count
+
+from sorting.quick_sort import (
+    INSERTION_SORT_THRESHOLD,
+    choose_pivot,
+    insertion_sort,
+    partition3,
+    quick_sort,
+    swap,
+)
+
+
+def _median_of_medians(arr, lb, ub):
+    """
+    Index of a pivot for arr[lb..ub] that has at least 3/10 of the range
+    on either side: the median of the medians of groups of five
+    """
+    groups = 0
+    for start in range(lb, ub + 1, 5):
+        end = min(start + 4, ub)
+        insertion_sort(arr, start, end)
+        # Gather the group medians at the front of the range
+        swap(arr, lb + groups, (start + end) // 2)
+        groups += 1
+    mid = lb + (groups - 1) // 2
+    _introselect(arr, lb, lb + groups - 1, mid, 0)
+    return mid
+
+
+def _introselect(arr, lb, ub, n, depth):
+    # depth counts the quickselect rounds left before median-of-medians
+    while ub - lb + 1 > INSERTION_SORT_THRESHOLD:
+        if depth == 0:
+            pivot = _median_of_medians(arr, lb, ub)
+        else:
+            depth -= 1
+            pivot = choose_pivot(arr, lb, ub)
+
+        lt, gt = partition3(arr, lb, ub, pivot)
+        if n < lt:
+            ub = lt - 1
+        elif n > gt:
+            lb = gt + 1
+        else:
+            return
+
+    insertion_sort(arr, lb, ub)
+
+
+def nth_element(arr, n, lb=0, ub=None):
+    """
+    Rearrange arr[lb..ub] (inclusive) in place so that arr[n] holds the
+    element a full sort would put there, with nothing greater before it
+    and nothing smaller after it. O(n) worst case.
+
+    Raises:
+        IndexError: If n is outside [lb, ub]
+    """
+    if ub is None:
+        ub = len(arr) - 1
+    if not lb <= n <= ub:
+        raise IndexError("nth_element index out of range")
+    _introselect(arr, lb, ub, n, 2 * (ub - lb + 1).bit_length())
+
+
+def partial_sort(arr, k):
+    """
+    Rearrange arr in place so that arr[:k] holds its k smallest elements in
+    sorted order; the order of the rest is unspecified. O(n + k log k).
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return
+    if k < len(arr):
+        nth_element(arr, k - 1)
+    quick_sort(arr, 0, k - 1)
+
+
+def top_k(iterable, k, key=None):
+    """
+    The k largest items of an iterable, largest first
+
+    Keeps a min-heap of the best k items seen so far, so the input is read
+    once and may be an unbounded stream. Items with equal keys keep their
+    input order, as in heapq.nlargest.
+
+    Args:
+        iterable (iterable): The items, consumed once
+        k (int): How many items to keep
+        key (callable, optional): Function computing the key of an item
+
+    Returns:
+        list: Up to k items, in descending order of key
+    """
+    if k <= 0:
+        return []
+
+    # Entries are (key, -arrival, item): among equal keys the latest
+    # arrival is the smallest, so it is the first to be evicted
+    heap = []
+    order = count(0, -1)
+    items = iter(iterable)
+
+    for item in items:
+        heap.append((item if key is None else key(item), next(order), item))
+        if len(heap) == k:
+            break
+    heapq.heapify(heap)
+
+    for item in items:
+        item_key = item if key is None else key(item)
+        if heap[0][0] < item_key:
+            heapq.heapreplace(heap, (item_key, next(order), item))
+
+    heap.sort(reverse=True)
+    return [item for _, _, item in heap]
+
+
+if __name__ == "__main__":
+    arr = [10, 50, 60, 40, 30, 20, 70, 90, 80, 0, 1]
+    nth_element(arr, len(arr) // 2)
+    print("median:", arr[len(arr) // 2])
+    partial_sort(arr, 3)
+    print("3 smallest:", arr[:3])
+    print("3 largest:", top_k(iter(arr), 3))
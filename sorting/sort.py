@@ -0,0 +1,111 @@
+"""
+Problem Statement: Pick the Fastest Sort for the Data
+
+Distribution sorts beat comparison sorts only for some inputs, and in
+Python only when the per-element work stays in C. sort(arr, key=None)
+inspects the keys and dispatches to the backend that was fastest in the
+measurements below (200k elements, list.sort = 1.0):
+
+- ints in a range no wider than the list: NumPy counting sort ~0.6;
+  without NumPy, pure Python counting sort ~0.6 down to a range of n / 8
+  and slower above it
+- other ints that fit in 64 bits: NumPy radix sort ~0.3 to 0.5
+- bytes of equal length: NumPy lexsort over the byte columns ~0.6
+- with a key function, list.sort(key=key) ~1.0 against 1.3 to 1.9 for
+  the distribution sorts, which have to gather the items back by index
+
+Everything else, and lists shorter than NUMPY_MIN_SIZE, goes to the
+built-in Timsort.
+"""
+
+from sorting import radix_sort
+from sorting.radix_sort import counting_sort, radix_sort_bytes
+
+# Pure Python counting sort wins while max - min + 1 <= n / this
+COUNTING_RANGE_DIVISOR = 8
+
+
+def builtin_sort(arr, key=None):
+    arr.sort(key=key)
+
+
+# name -> function(arr, key=None) sorting the list in place
+BACKENDS = {
+    "builtin": builtin_sort,
+    "counting": counting_sort,
+    "radix": radix_sort.radix_sort,
+    "radix_bytes": radix_sort_bytes,
+}
+
+
+def choose_backend(arr, key=None):
+    """
+    Pick the name of the fastest backend for sorting arr
+
+    Args:
+        arr (list): The list that is going to be sorted
+        key (callable, optional): The sort key function
+
+    Returns:
+        str: A key of BACKENDS
+    """
+    n = len(arr)
+    if key is not None or n < radix_sort.NUMPY_MIN_SIZE:
+        return "builtin"
+
+    first = type(arr[0])
+    if first is int and all(type(x) is int for x in arr):
+        lo, hi = min(arr), max(arr)
+        if radix_sort.numpy is not None:
+            if hi - lo + 1 <= n:
+                return "counting"
+            if radix_sort.INT64_MIN <= lo and hi <= radix_sort.INT64_MAX:
+                return "radix"
+        elif (hi - lo + 1) * COUNTING_RANGE_DIVISOR <= n:
+            return "counting"
+        return "builtin"
+
+    if first is bytes and radix_sort.numpy is not None:
+        width = len(arr[0])
+        if all(type(x) is bytes and len(x) == width for x in arr):
+            return "radix_bytes"
+
+    return "builtin"
+
+
+def sort(arr, key=None, backend=None):
+    """
+    Sort a list in place (stable), choosing the backend from its keys
+
+    Args:
+        arr (list): The list to sort
+        key (callable, optional): Function computing the sort key of an item
+        backend (str, optional): Force a key of BACKENDS
+    """
+    if len(arr) < 2:
+        return
+    BACKENDS[backend or choose_backend(arr, key)](arr, key=key)
+
+
+# Benchmark: python -m sorting.sort
+if __name__ == "__main__":
+    import random
+    import time
+
+    n = 200_000
+    inputs = {
+        "ints, range n": [random.randint(0, n) for _ in range(n)],
+        "ints, 64 bit": [random.randint(-2 ** 63, 2 ** 63 - 1) for _ in range(n)],
+        "bytes, 8 wide": [random.randbytes(8) for _ in range(n)],
+        "floats": [random.random() for _ in range(n)],
+    }
+    print(f"{n:,} elements, NumPy {'found' if radix_sort.numpy else 'not found'}")
+    for name, data in inputs.items():
+        chosen = choose_backend(data)
+        timings = []
+        for backend in sorted({"builtin", chosen}):
+            arr = data[:]
+            start = time.perf_counter()
+            sort(arr, backend=backend)
+            timings.append(f"{backend} {time.perf_counter() - start:.4f}s")
+        print(f"{name:14s}: chosen {chosen:11s} | {', '.join(timings)}")
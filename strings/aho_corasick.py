@@ -0,0 +1,192 @@
+"""
+Problem Statement: Implement the Aho-Corasick Multi-Pattern Matching Automaton
+
+Searching a text for k patterns with KMP costs one pass over the text per
+pattern (O(n·k)). The Aho-Corasick algorithm puts all patterns in a trie and
+adds two kinds of links to every node:
+- a failure link to the node of the longest proper suffix of the node's
+  string that is also in the trie (like the KMP LPS array, but for a set of
+  patterns)
+- an output link to the nearest node along the failure chain that ends a
+  pattern, so every match ending at a position is reported without walking
+  failure links that end no pattern
+
+With these links the text is scanned once, and all occurrences of all
+patterns are found in O(n + total pattern length + number of matches).
+
+Operations to implement:
+1. Add patterns to the automaton (incrementally)
+2. Build the failure and output links
+3. Find all occurrences of all patterns in a single pass over the text
+
+Applications:
+- Keyword and dictionary scanning
+- Network intrusion detection (signature matching)
+- Virus scanning
+- Bioinformatics (matching many motifs at once)
+"""
+
+from collections import deque
+
+from strings.trie import Trie, TrieNode
+
+
+class AhoCorasickNode(TrieNode):
+    """A trie node with the links used by the Aho-Corasick automaton"""
+    
+    def __init__(self):
+        super().__init__()
+        
+        # Node of the longest proper suffix that is also in the trie
+        self.fail = None
+        
+        # Nearest node on the failure chain that ends a pattern
+        self.output = None
+        
+        # The pattern ending at this node (set when is_end_of_word is True)
+        self.pattern = None
+
+
+class AhoCorasick(Trie):
+    """Aho-Corasick automaton built on top of the Trie"""
+    
+    node_class = AhoCorasickNode
+    
+    def __init__(self, patterns=()):
+        """
+        Initialize the automaton, optionally with an initial set of patterns
+        
+        Args:
+            patterns (iterable): Patterns to add before building
+        """
+        super().__init__()
+        self._built = False
+        for pattern in patterns:
+            self.add_pattern(pattern)
+        self.build()
+    
+    def insert(self, word):
+        """
+        Insert a pattern into the trie and remember it at its end node
+        
+        The links are not updated; call build() before searching again.
+        
+        Args:
+            word (str): The pattern to insert
+        """
+        if not word:
+            raise ValueError("pattern must be non-empty")
+        
+        super().insert(word)
+        
+        node = self.root
+        for char in word:
+            node = node.children[char]
+        node.pattern = word
+        
+        self._built = False
+    
+    def add_pattern(self, pattern):
+        """
+        Add a pattern to the automaton
+        
+        The links are not updated; call build() before searching again.
+        
+        Args:
+            pattern (str): The pattern to add
+        """
+        self.insert(pattern)
+    
+    def build(self):
+        """
+        Compute the failure and output links of every node (BFS order, so
+        each node's failure target is finished before the node itself)
+        """
+        root = self.root
+        root.fail = root
+        root.output = None
+        queue = deque()
+        
+        for child in root.children.values():
+            child.fail = root
+            child.output = None
+            queue.append(child)
+        
+        while queue:
+            node = queue.popleft()
+            
+            for char, child in node.children.items():
+                # Follow the parent's failure chain until the character can be extended
+                fail = node.fail
+                while fail is not root and char not in fail.children:
+                    fail = fail.fail
+                child.fail = fail.children.get(char, root)
+                
+                target = child.fail
+                child.output = target if target.is_end_of_word else target.output
+                
+                queue.append(child)
+        
+        self._built = True
+    
+    def iter_matches(self, text):
+        """
+        Lazily yield every occurrence of every pattern in the text
+        
+        Args:
+            text (str): The text to search in
+            
+        Yields:
+            tuple: (start index, pattern) in order of the match's end index
+        """
+        if not self._built:
+            raise RuntimeError("patterns were added since the last build(); call build() first")
+        
+        root = self.root
+        node = root
+        
+        for i, char in enumerate(text):
+            # Fall back along the failure links until the character can be consumed
+            while node is not root and char not in node.children:
+                node = node.fail
+            node = node.children.get(char, root)
+            
+            # Report the pattern ending here and all patterns that are its suffixes
+            match = node if node.is_end_of_word else node.output
+            while match is not None:
+                yield i - len(match.pattern) + 1, match.pattern
+                match = match.output
+    
+    def find_all(self, text):
+        """
+        Find every occurrence of every pattern in the text
+        
+        (search(word), inherited from Trie, still tells whether a pattern
+        was added.)
+        
+        Args:
+            text (str): The text to search in
+            
+        Returns:
+            dict: Pattern -> list of indices where it occurs in the text
+        """
+        result = {}
+        for start, pattern in self.iter_matches(text):
+            result.setdefault(pattern, []).append(start)
+        return result
+
+
+# Example usage
+if __name__ == "__main__":
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    
+    text = "ahishers"
+    print(f"Text: {text}")
+    for start, pattern in automaton.iter_matches(text):
+        print(f"Pattern '{pattern}' found at position {start}")
+    
+    # Add more patterns, then rebuild the links
+    automaton.add_pattern("is")
+    automaton.add_pattern("r")
+    automaton.build()
+    print(f"All matches after adding 'is' and 'r': {automaton.find_all(text)}")
@@ -0,0 +1,168 @@
+"""
+Problem Statement: Approximate Pattern Matching with Bit-Parallelism
+
+Exact matchers such as kmp_search miss occurrences that contain errors. Two
+approximate variants:
+
+1. k-mismatch (Hamming distance): find every window of the text that differs
+   from the pattern in at most k positions.
+2. k-differences (edit distance): find every position where some substring
+   ending there can be turned into the pattern with at most k insertions,
+   deletions or substitutions.
+
+The textbook dynamic program fills an m x n table (O(n·m) Python steps).
+Both algorithms below keep one column of that table packed into the bits
+of an integer and update the whole column with a handful of bitwise
+operations per text character. Python ints have arbitrary width, so a
+pattern of length m costs O(⌈m/w⌉) machine-word operations per character,
+O(n·⌈m/w⌉) in total.
+
+- Shift-Or (Bitap, Baeza-Yates-Gonnet / Wu-Manber): bit j of state R[d] is
+  0 iff pattern[:j + 1] matches the text ending here with at most d
+  mismatches.
+- Myers' bit-vector algorithm: the column of edit distances is stored as
+  its vertical deltas (+1 / -1 bit-vectors), and the score of the last row
+  is tracked directly.
+
+Operations to implement:
+1. Find all windows within Hamming distance k of the pattern
+2. Find all end positions within edit distance k of the pattern
+
+Applications:
+- DNA read alignment
+- Spell checking and fuzzy search (agrep)
+- Searching noisy data
+"""
+
+
+def _pattern_masks(pattern, matching_bit):
+    """
+    Build the per-character bit masks of the pattern
+
+    Args:
+        pattern (sequence): The pattern
+        matching_bit (int): 1 to set the bits where the character occurs
+            (Myers), 0 to clear them (Shift-Or)
+
+    Returns:
+        dict: Character -> mask
+    """
+    m = len(pattern)
+    full = (1 << m) - 1
+    masks = {}
+    for i, char in enumerate(pattern):
+        if matching_bit:
+            masks[char] = masks.get(char, 0) | (1 << i)
+        else:
+            masks[char] = masks.get(char, full) & ~(1 << i)
+    return masks
+
+
+def bitap_mismatch_search(text, pattern, k):
+    """
+    Find all windows of the text within Hamming distance k of the pattern
+    (Shift-Or with k + 1 state vectors)
+
+    Args:
+        text (sequence): The text to search in
+        pattern (sequence): The pattern to search for
+        k (int): Maximum number of mismatches
+
+    Returns:
+        list: (end, mismatches) pairs, where text[end - m:end] is the window
+    """
+    m = len(pattern)
+    if m == 0:
+        raise ValueError("pattern must be non-empty")
+
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    masks = _pattern_masks(pattern, 0)
+
+    # states[d]: a 0 bit j means pattern[:j + 1] matches with <= d mismatches
+    states = [full] * (k + 1)
+    result = []
+
+    for i, char in enumerate(text):
+        mask = masks.get(char, full)
+        previous = states[0]
+        states[0] = ((previous << 1) | mask) & full
+        for d in range(1, k + 1):
+            current = states[d]
+            # Either match this character, or spend a mismatch on it
+            states[d] = ((current << 1) | mask) & (previous << 1) & full
+            previous = current
+
+        if i + 1 >= m:
+            for d in range(k + 1):
+                if not states[d] & last:
+                    result.append((i + 1, d))
+                    break
+
+    return result
+
+
+def myers_search(text, pattern, k):
+    """
+    Find all positions where a substring ending there is within edit
+    distance k of the pattern (Myers' bit-vector algorithm)
+
+    Args:
+        text (sequence): The text to search in
+        pattern (sequence): The pattern to search for
+        k (int): Maximum edit distance
+
+    Returns:
+        list: (end, distance) pairs, where the best match is a substring of
+        text[:end] ending at end, with the smallest distance for that end
+    """
+    m = len(pattern)
+    if m == 0:
+        raise ValueError("pattern must be non-empty")
+
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    peq = _pattern_masks(pattern, 1)
+
+    # Vertical deltas of the current column: +1 (pv) / -1 (mv) per row
+    pv = full
+    mv = 0
+    score = m
+    result = []
+
+    for i, char in enumerate(text):
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+
+        # Horizontal deltas
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+
+        # The first row is always 0 (a match may start anywhere), so no
+        # carry is shifted into bit 0
+        ph = (ph << 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+
+        if score <= k:
+            result.append((i + 1, score))
+
+    return result
+
+
+# Example usage
+if __name__ == "__main__":
+    text = "ACGTTGCAACGATGCAACGTTACA"
+    pattern = "ACGTTG"
+
+    print(f"Text: {text}, pattern: {pattern}")
+    for end, mismatches in bitap_mismatch_search(text, pattern, 2):
+        print(f"  {mismatches} mismatches: '{text[end - len(pattern):end]}' at {end - len(pattern)}")
+    print(f"Edit distance <= 1 ends: {myers_search(text, pattern, 1)}")
@@ -0,0 +1,233 @@
+"""
+Problem Statement: Implement an FM-Index over the Burrows-Wheeler Transform
+
+The Burrows-Wheeler transform (BWT) of text$ lists, for every suffix in
+suffix array order, the character just before it. It is read straight off
+the suffix array: bwt[r] = text[sa[r] - 1].
+
+The FM-index answers pattern queries from the BWT alone:
+- C[c] is the number of characters smaller than c in text$
+- rank(c, i) is the number of occurrences of c in bwt[:i]
+- the rows whose suffixes start with c + P are
+  [C[c] + rank(c, lo), C[c] + rank(c, hi)) when [lo, hi) are the rows of P,
+  so a pattern is matched backwards, one character per step (O(m))
+- the LF mapping LF(r) = C[bwt[r]] + rank(bwt[r], r) moves from the row of
+  the suffix at position p to the row of the suffix at p - 1
+
+Memory is kept small by sampling:
+- rank is stored every occ_sample rows and the rest counted from the BWT
+- the suffix array is kept only for text positions divisible by sa_sample;
+  locate walks LF from a row until it reaches a sampled one (at most
+  sa_sample - 1 steps)
+Larger sampling rates use less memory and locate more slowly.
+
+Operations to implement:
+1. Compute the BWT from the suffix array
+2. Count the occurrences of a pattern without the text
+3. Locate the occurrences with a sampled suffix array
+
+Applications:
+- Read alignment in bioinformatics (BWA, Bowtie)
+- Compressed full-text indexes
+- Data compression (bzip2)
+"""
+
+from array import array
+
+from strings.suffix_array import build_suffix_array
+
+
+def burrows_wheeler_transform(text, suffix_array=None):
+    """
+    Compute the BWT of text$ from the suffix array of text
+
+    The sentinel $ is smaller than every character, so the suffix array of
+    text$ is [n] + suffix_array, and the sentinel itself is left out of
+    the result: its row is returned instead.
+
+    Args:
+        text (str or bytes): The input string
+        suffix_array (array, optional): The suffix array of the text
+
+    Returns:
+        tuple: (bwt, sentinel row) where bwt has the same type as text and
+        the sentinel sits before bwt[sentinel row]
+    """
+    if suffix_array is None:
+        suffix_array = build_suffix_array(text)
+
+    n = len(text)
+    empty = text[:0]
+    if n == 0:
+        return empty, 0
+
+    # Row 0 is the suffix "$", preceded by the last character
+    last_column = [text[n - 1:n]]
+    sentinel_row = 0
+    for row, start in enumerate(suffix_array, 1):
+        if start == 0:
+            sentinel_row = row
+        else:
+            last_column.append(text[start - 1:start])
+
+    return empty.join(last_column), sentinel_row
+
+
+class FMIndex:
+    """FM-index with sampled rank checkpoints and a sampled suffix array"""
+
+    def __init__(self, text, occ_sample=64, sa_sample=32):
+        """
+        Build the index; the text is not kept
+
+        Args:
+            text (str or bytes): The text to index
+            occ_sample (int): Rows between two rank checkpoints
+            sa_sample (int): Keep the suffix array entries of the text
+                positions divisible by this
+
+        Raises:
+            ValueError: If occ_sample or sa_sample is less than 1
+        """
+        if occ_sample < 1:
+            raise ValueError("occ_sample must be at least 1")
+        if sa_sample < 1:
+            raise ValueError("sa_sample must be at least 1")
+        suffix_array = build_suffix_array(text)
+        n = len(text)
+        self.n = n
+        self.occ_sample = occ_sample
+        self.sa_sample = sa_sample
+
+        # Character codes 1..K in sorted order; 0 is the sentinel
+        alphabet = sorted(set(text))
+        self._codes = {char: code for code, char in enumerate(alphabet, 1)}
+        sigma = len(alphabet) + 1
+
+        codes = array('i', [0]) * (n + 1)
+        if n:
+            codes[0] = self._codes[text[n - 1]]
+        for row, start in enumerate(suffix_array, 1):
+            codes[row] = self._codes[text[start - 1]] if start else 0
+
+        # Small alphabets store one byte per row and rank with bytes.count
+        self._bwt = bytes(codes.tolist()) if sigma <= 256 else codes
+
+        # C[c]: number of characters smaller than c in text$
+        counts = [0] * sigma
+        for code in codes:
+            counts[code] += 1
+        self._c = array('i', [0]) * (sigma + 1)
+        for code in range(sigma):
+            self._c[code + 1] = self._c[code] + counts[code]
+
+        # occ[c][b]: occurrences of c in bwt[:b * occ_sample]
+        blocks = n // occ_sample + 2
+        self._occ = [array('i', [0]) * blocks for _ in range(sigma)]
+        running = [0] * sigma
+        for row, code in enumerate(codes):
+            if row % occ_sample == 0:
+                for c in range(sigma):
+                    self._occ[c][row // occ_sample] = running[c]
+            running[code] += 1
+        if (n + 1) % occ_sample == 0:
+            for c in range(sigma):
+                self._occ[c][(n + 1) // occ_sample] = running[c]
+
+        # Sampled suffix array: marked rows, their text positions in row
+        # order, and rank checkpoints over the marks
+        self._marked = bytearray(n + 1)
+        self._samples = array('i')
+        for row in range(n + 1):
+            position = suffix_array[row - 1] if row else n
+            if position % sa_sample == 0:
+                self._marked[row] = 1
+                self._samples.append(position)
+        self._mark_rank = array('i', [0]) * blocks
+        marks = 0
+        for row in range(0, n + 1, occ_sample):
+            self._mark_rank[row // occ_sample] = marks
+            marks += self._marked.count(1, row, row + occ_sample)
+
+    def _rank(self, code, i):
+        """Occurrences of code in bwt[:i]"""
+        block = i // self.occ_sample
+        start = block * self.occ_sample
+        result = self._occ[code][block]
+        if isinstance(self._bwt, bytes):
+            return result + self._bwt.count(code, start, i)
+        bwt = self._bwt
+        for row in range(start, i):
+            if bwt[row] == code:
+                result += 1
+        return result
+
+    def _lf(self, row):
+        code = self._bwt[row]
+        return self._c[code] + self._rank(code, row)
+
+    def _rows(self, pattern):
+        """
+        Backward search
+
+        Returns:
+            tuple: The half-open range of rows whose suffixes start with the pattern
+        """
+        low, high = 0, self.n + 1
+        for char in reversed(pattern):
+            code = self._codes.get(char)
+            if code is None:
+                return 0, 0
+            low = self._c[code] + self._rank(code, low)
+            high = self._c[code] + self._rank(code, high)
+            if low >= high:
+                return 0, 0
+        return low, high
+
+    def count(self, pattern):
+        """
+        Count the occurrences of a pattern in O(m) rank queries
+
+        Args:
+            pattern (str or bytes): The pattern to count
+
+        Returns:
+            int: Number of occurrences
+        """
+        low, high = self._rows(pattern)
+        return high - low
+
+    def locate(self, pattern):
+        """
+        Find the positions of all occurrences of a pattern
+
+        Args:
+            pattern (str or bytes): The pattern to search for
+
+        Returns:
+            list: Sorted indices where the pattern occurs in the text
+        """
+        low, high = self._rows(pattern)
+        result = []
+        for row in range(low, high):
+            steps = 0
+            while not self._marked[row]:
+                row = self._lf(row)
+                steps += 1
+            block = row // self.occ_sample
+            sample = self._mark_rank[block] + self._marked.count(1, block * self.occ_sample, row)
+            result.append(self._samples[sample] + steps)
+        result.sort()
+        return result
+
+
+# Example usage
+if __name__ == "__main__":
+    text = "mississippi"
+    bwt, sentinel_row = burrows_wheeler_transform(text)
+    print(f"Text: {text}")
+    print(f"BWT: {bwt[:sentinel_row]}${bwt[sentinel_row:]}")  # ipssm$pissii
+
+    index = FMIndex(text, occ_sample=4, sa_sample=4)
+    for pattern in ["ssi", "i", "issi", "xyz"]:
+        print(f"'{pattern}': count {index.count(pattern)}, positions {index.locate(pattern)}")
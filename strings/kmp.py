@@ -14,6 +14,8 @@ avoiding the need to recheck characters we already know.
 Operations to implement:
 1. Compute the LPS array for a given pattern
 2. Use the KMP algorithm to find all occurrences of a pattern in a text
+3. Match a pattern against a stream of chunks, keeping only the match state
+4. Compile a pattern into a KMP automaton (DFA) and cache compiled patterns
 
 Applications:
 - Efficient string searching
@@ -22,6 +24,13 @@ Applications:
 - Network intrusion detection systems
 """
 
+from array import array
+from functools import lru_cache
+
+# Number of compiled patterns kept by compile()
+COMPILE_CACHE_SIZE = 1024
+
+
 def compute_lps_array(pattern, m, lps):
     """
     Compute the Longest Proper Prefix which is also Suffix (LPS) array
@@ -34,14 +43,14 @@ def compute_lps_array(pattern, m, lps):
     i = 0  # Length of the previous longest prefix & suffix
 
     for q in range(1, m):
-        # If characters match, extend the current prefix & suffix
-        if pattern[i] == pattern[q]:
-            i = i + 1
-
         # If characters don't match, find the next longest prefix & suffix
         while i > 0 and pattern[i] != pattern[q]:
             i = lps[i - 1]
 
+        # If characters match, extend the current prefix & suffix
+        if pattern[i] == pattern[q]:
+            i = i + 1
+
         # Set the LPS value for the current position
         lps[q] = i
 
@@ -84,7 +93,6 @@ def kmp_search(pattern, message):
         # If we've found a complete match
         if j == m:
             results.append(i - j)
-            print('Found the pattern at index {}'.format(i - j))
             # Look for the next match, starting after a prefix of the current match
             j = lps[j - 1]
         # If characters don't match
@@ -99,6 +107,221 @@ def kmp_search(pattern, message):
     return results
 
 
+class KMPMatcher:
+    """
+    Stateful KMP matcher that is fed the text in chunks
+
+    The LPS table and the currently matched length are kept between calls,
+    so matches that cross chunk boundaries are found and memory use does
+    not depend on the size of the input.
+    """
+
+    def __init__(self, pattern):
+        """
+        Compile the pattern
+
+        Args:
+            pattern (str or bytes): The pattern to search for
+        """
+        if not pattern:
+            raise ValueError('pattern must be non-empty')
+
+        self.pattern = pattern
+        self.lps = [0] * len(pattern)
+        compute_lps_array(pattern, len(pattern), self.lps)
+
+        # Length of the pattern prefix matched at the end of the input so far
+        self.matched = 0
+
+        # Number of characters consumed so far
+        self.position = 0
+
+    def reset(self):
+        """Forget the input seen so far"""
+        self.matched = 0
+        self.position = 0
+
+    def feed(self, chunk):
+        """
+        Consume the next chunk of the text
+
+        Args:
+            chunk (str or bytes): The next part of the text
+
+        Returns:
+            list: Absolute start offsets of the matches that end in this chunk
+        """
+        pattern = self.pattern
+        lps = self.lps
+        m = len(pattern)
+        j = self.matched
+        base = self.position - m + 1
+        results = []
+
+        for i, char in enumerate(chunk):
+            # On a mismatch, fall back to the longest prefix that is also a suffix
+            while j > 0 and pattern[j] != char:
+                j = lps[j - 1]
+            if pattern[j] == char:
+                j += 1
+            if j == m:
+                results.append(base + i)
+                j = lps[j - 1]
+
+        self.matched = j
+        self.position += len(chunk)
+        return results
+
+    def finditer(self, chunks):
+        """
+        Lazily yield the absolute start offsets of all matches in a stream
+
+        Args:
+            chunks (iterable): Parts of the text, e.g. blocks read from a file
+
+        Yields:
+            int: Start offset of each match, in increasing order
+        """
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+
+def kmp_search_stream(pattern, chunks):
+    """
+    Search a chunked text (a file, a socket, a generator) for a pattern
+
+    Args:
+        pattern (str or bytes): The pattern to search for
+        chunks (iterable): Parts of the text
+
+    Yields:
+        int: Start offset of each match in the whole text
+    """
+    return KMPMatcher(pattern).finditer(chunks)
+
+
+class CompiledKMP:
+    """
+    A pattern compiled into the full KMP automaton
+
+    State j means that the last j characters read match the first j
+    characters of the pattern. The transition table already contains the
+    result of every LPS fallback, so matching is one table lookup per input
+    character. bytes patterns get a dense table of 256 entries per state;
+    str patterns get one dict per state over the pattern's alphabet (any
+    other character leads back to state 0).
+    """
+
+    def __init__(self, pattern):
+        """
+        Build the transition table
+
+        Args:
+            pattern (str or bytes): The pattern to compile
+        """
+        if not pattern:
+            raise ValueError('pattern must be non-empty')
+
+        self.pattern = pattern
+        m = len(pattern)
+        self.is_bytes = not isinstance(pattern, str)
+
+        if self.is_bytes:
+            # Dense table: transitions[state * 256 + byte]
+            table = array('i', [0]) * ((m + 1) * 256)
+            table[pattern[0]] = 1
+            x = 0  # State reached on the pattern without its first character
+            for j in range(1, m + 1):
+                row = j * 256
+                table[row:row + 256] = table[x * 256:x * 256 + 256]
+                if j < m:
+                    table[row + pattern[j]] = j + 1
+                    x = table[x * 256 + pattern[j]]
+            self.transitions = table
+        else:
+            # Sparse table: one {char: next state} dict per state
+            rows = [{pattern[0]: 1}]
+            x = 0
+            for j in range(1, m + 1):
+                row = {char: state for char, state in rows[x].items() if state}
+                if j < m:
+                    row[pattern[j]] = j + 1
+                    x = rows[x].get(pattern[j], 0)
+                rows.append(row)
+            self.transitions = rows
+
+    def finditer(self, text):
+        """
+        Lazily yield the start offsets of all matches
+
+        Args:
+            text (str or bytes): The text to search in
+
+        Yields:
+            int: Start offset of each match
+        """
+        m = len(self.pattern)
+        state = 0
+
+        if self.is_bytes:
+            table = self.transitions
+            for i, byte in enumerate(text):
+                state = table[(state << 8) | byte]
+                if state == m:
+                    yield i - m + 1
+        else:
+            rows = self.transitions
+            for i, char in enumerate(text):
+                state = rows[state].get(char, 0)
+                if state == m:
+                    yield i - m + 1
+
+    def search(self, text):
+        """
+        Find all occurrences of the pattern
+
+        Args:
+            text (str or bytes): The text to search in
+
+        Returns:
+            list: Indices where the pattern occurs in the text
+        """
+        return list(self.finditer(text))
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_cached(pattern):
+    return CompiledKMP(pattern)
+
+
+def compile(pattern):
+    """
+    Compile a pattern into a KMP automaton, reusing recently compiled ones
+
+    Compiled patterns are kept in a bounded LRU cache; see
+    compile_cache_info() for its hit and miss counters.
+
+    Args:
+        pattern (str or bytes): The pattern to compile
+
+    Returns:
+        CompiledKMP: The compiled pattern
+    """
+    if isinstance(pattern, (bytearray, memoryview)):
+        pattern = bytes(pattern)
+    return _compile_cached(pattern)
+
+
+def compile_cache_info():
+    """Return the hits, misses, maxsize and currsize of the compile() cache"""
+    return _compile_cached.cache_info()
+
+
+def compile_cache_clear():
+    """Empty the compile() cache and reset its counters"""
+    _compile_cached.cache_clear()
+
+
 if __name__ == '__main__':
     txt = 'ABABDABACDABABCABAB'
     pat = 'ABABCABAB'
@@ -111,3 +334,12 @@ if __name__ == '__main__':
         print(f"Pattern '{pat}' found at positions: {occurrences}")
     else:
         print(f"Pattern '{pat}' not found in the text")
+
+    # Feed the same text in small chunks; matches may cross chunk boundaries
+    chunks = [txt[i:i + 4] for i in range(0, len(txt), 4)]
+    print(f"Streaming matches: {list(kmp_search_stream(pat, chunks))}")
+
+    # Compiled automata are cached, so repeated searches skip preprocessing
+    for _ in range(3):
+        compiled = compile(pat)
+    print(f"Compiled matches: {compiled.search(txt)}, cache: {compile_cache_info()}")
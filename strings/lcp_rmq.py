@@ -0,0 +1,143 @@
+"""
+Problem Statement: Answer LCP Queries for Any Two Suffixes in O(1)
+
+The LCP array stores the longest common prefix of suffixes that are
+adjacent in the suffix array. For any two ranks i < j, the LCP of the
+suffixes at those ranks is the minimum of lcp[i + 1..j], because the
+suffixes in between are sorted. So an arbitrary-pair LCP query is a range
+minimum query (RMQ) over the LCP array.
+
+A sparse table answers RMQ in O(1) after O(n log n) preprocessing: level k
+stores the minimum of every window of length 2^k, and any range is covered
+by two (overlapping) windows of the largest power of two that fits.
+
+All levels are stored in one flat array('i'), level k starting at k * n.
+
+Operations to implement:
+1. Build a sparse table over an integer array
+2. Answer range minimum queries in O(1)
+3. Answer the LCP of two suffixes by suffix array rank or by text position
+
+Applications:
+- Longest common extension queries
+- Suffix array based string algorithms (repeats, tandem arrays)
+- Lowest common ancestor queries (via the Euler tour)
+"""
+
+from array import array
+
+from strings.suffix_array import build_inverse_suffix_array
+
+
+class SparseTable:
+    """Static range minimum queries in O(1)"""
+
+    def __init__(self, values):
+        """
+        Build all levels of the table
+
+        Args:
+            values (sequence): The integers to query
+        """
+        n = len(values)
+        self.n = n
+        levels = max(n.bit_length(), 1)
+        table = array('i', values)
+        table.extend(array('i', [0]) * (n * (levels - 1)))
+
+        # Level k: table[k * n + i] = min(values[i:i + 2 ** k])
+        for k in range(1, levels):
+            half = 1 << (k - 1)
+            row = k * n
+            previous = row - n
+            for i in range(n - (1 << k) + 1):
+                left = table[previous + i]
+                right = table[previous + i + half]
+                table[row + i] = left if left < right else right
+
+        self.table = table
+
+    def query(self, left, right):
+        """
+        Minimum of values[left..right] (inclusive)
+
+        Args:
+            left (int): First index of the range
+            right (int): Last index of the range
+
+        Returns:
+            int: The minimum value
+        """
+        k = (right - left + 1).bit_length() - 1
+        row = k * self.n
+        a = self.table[row + left]
+        b = self.table[row + right - (1 << k) + 1]
+        return a if a < b else b
+
+
+class SuffixLCPIndex:
+    """LCP of any two suffixes in O(1), by rank or by text position"""
+
+    def __init__(self, suffix_array, lcp_array, inverse_suffix_array=None):
+        """
+        Args:
+            suffix_array (array): The suffix array of the text
+            lcp_array (array): The LCP array of the text
+            inverse_suffix_array (array, optional): The rank of every
+                position; built from the suffix array if not given
+        """
+        self.suffix_array = suffix_array
+        if inverse_suffix_array is None:
+            inverse_suffix_array = build_inverse_suffix_array(suffix_array)
+        self.rank = inverse_suffix_array
+        self.rmq = SparseTable(lcp_array)
+        self.n = len(suffix_array)
+
+    def lcp_ranks(self, i, j):
+        """
+        LCP of the suffixes at suffix array ranks i and j
+
+        Same arguments as suffix_array.longest_common_prefix, in O(1).
+
+        Args:
+            i (int): Rank of the first suffix
+            j (int): Rank of the second suffix
+
+        Returns:
+            int: Length of the longest common prefix
+        """
+        if i == j:
+            return self.n - self.suffix_array[i]
+        if i > j:
+            i, j = j, i
+        return self.rmq.query(i + 1, j)
+
+    def lcp_positions(self, a, b):
+        """
+        LCP of the suffixes starting at text positions a and b
+
+        Args:
+            a (int): Start of the first suffix
+            b (int): Start of the second suffix
+
+        Returns:
+            int: Length of the longest common prefix
+        """
+        if a == b:
+            return self.n - a
+        return self.lcp_ranks(self.rank[a], self.rank[b])
+
+
+# Example usage
+if __name__ == "__main__":
+    from strings.suffix_array import build_lcp_array, build_suffix_array
+
+    text = "abracadabra"
+    suffix_array = build_suffix_array(text)
+    lcp_array = build_lcp_array(text, suffix_array)
+    index = SuffixLCPIndex(suffix_array, lcp_array)
+
+    print(f"Text: {text}")
+    print(f"LCP of positions 0 and 7: {index.lcp_positions(0, 7)}")  # 4 ('abra')
+    print(f"LCP of positions 1 and 8: {index.lcp_positions(1, 8)}")  # 3 ('bra')
+    print(f"LCP of ranks 0 and 4: {index.lcp_ranks(0, 4)}")
@@ -0,0 +1,225 @@
+"""
+Problem Statement: Find Palindromic Substrings in Linear Time
+
+A palindrome reads the same forwards and backwards. Two linear-time tools
+answer most palindrome questions about a string:
+
+1. Manacher's algorithm computes, for every center of the string, the radius
+   of the longest palindrome around it. It reuses the rightmost palindrome
+   found so far: the radius at a position inside it starts from the radius
+   at the mirrored position, so every character is compared O(1) times on
+   average.
+2. The palindromic tree (eertree) has one node per distinct palindromic
+   substring. Each node has edges "add the same character on both sides" and
+   a suffix link to its longest proper palindromic suffix. Characters are
+   appended one at a time, and each one adds at most one new node.
+
+Operations to implement:
+1. Compute the palindrome radius at every center (Manacher)
+2. Find the longest palindromic substring
+3. Count the distinct palindromic substrings (eertree)
+4. Append characters to the eertree one at a time (streaming)
+
+Applications:
+- String problems in competitive programming
+- Bioinformatics (palindromic DNA sites)
+- Text analysis
+"""
+
+from array import array
+
+
+def palindrome_radii(string):
+    """
+    Compute the palindrome radii at every center with Manacher's algorithm
+
+    Args:
+        string (str or bytes): The input string
+
+    Returns:
+        tuple: (odd, even) lists. odd[i] is the number of odd-length
+        palindromes centered at i, so the longest is
+        string[i - odd[i] + 1:i + odd[i]]. even[i] is the number of
+        even-length palindromes centered between i - 1 and i, so the longest
+        is string[i - even[i]:i + even[i]].
+    """
+    n = len(string)
+
+    # Odd-length palindromes; [left, right] is the rightmost one found so far
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and string[i - k] == string[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    # Even-length palindromes
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and string[i - k - 1] == string[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+
+    return odd, even
+
+
+def longest_palindromic_substring(string):
+    """
+    Find the longest palindromic substring in O(n)
+
+    Args:
+        string (str or bytes): The input string
+
+    Returns:
+        str or bytes: The leftmost longest palindromic substring
+    """
+    odd, even = palindrome_radii(string)
+
+    best_start, best_length = 0, 0
+    for i in range(len(string)):
+        if 2 * odd[i] - 1 > best_length:
+            best_start, best_length = i - odd[i] + 1, 2 * odd[i] - 1
+        if 2 * even[i] > best_length:
+            best_start, best_length = i - even[i], 2 * even[i]
+
+    return string[best_start:best_start + best_length]
+
+
+class PalindromicTree:
+    """
+    Palindromic tree (eertree) that is fed one character at a time
+
+    Node 0 is the imaginary root of length -1 and node 1 the empty
+    palindrome; every other node is a distinct palindromic substring.
+    """
+
+    def __init__(self):
+        """Initialize the tree with the two roots"""
+        self._chars = []
+
+        # Per node: palindrome length, suffix link, end position of its
+        # first occurrence and outgoing edges {char: node}
+        self._length = array("i", [-1, 0])
+        self._link = array("i", [0, 0])
+        self._end = array("i", [-1, -1])
+        self._edges = [{}, {}]
+
+        # Node of the longest palindromic suffix of the text so far
+        self._last = 1
+
+        # Node of the longest palindrome seen so far
+        self._longest = 1
+
+    def _suffix_with(self, node, position, char):
+        """Follow suffix links until char can be added around the node's palindrome"""
+        chars = self._chars
+        while True:
+            before = position - 1 - self._length[node]
+            if before >= 0 and chars[before] == char:
+                return node
+            node = self._link[node]
+
+    def append(self, char):
+        """
+        Append a character to the text
+
+        Args:
+            char: The next character
+
+        Returns:
+            bool: True if the text gained a new distinct palindrome
+        """
+        position = len(self._chars)
+        self._chars.append(char)
+
+        parent = self._suffix_with(self._last, position, char)
+        node = self._edges[parent].get(char)
+        if node is not None:
+            self._last = node
+            return False
+
+        length = self._length[parent] + 2
+        if length == 1:
+            link = 1
+        else:
+            link = self._edges[self._suffix_with(self._link[parent], position, char)][char]
+
+        node = len(self._length)
+        self._length.append(length)
+        self._link.append(link)
+        self._end.append(position)
+        self._edges.append({})
+        self._edges[parent][char] = node
+
+        self._last = node
+        if length > self._length[self._longest]:
+            self._longest = node
+        return True
+
+    def extend(self, chars):
+        """
+        Append every character of an iterable
+
+        Args:
+            chars (iterable): The characters to append
+        """
+        for char in chars:
+            self.append(char)
+
+    def __len__(self):
+        """Number of distinct non-empty palindromic substrings"""
+        return len(self._length) - 2
+
+    def longest_palindrome(self):
+        """
+        Get the longest palindromic substring of the text so far
+
+        Returns:
+            list: Its characters (join them for a str)
+        """
+        node = self._longest
+        end = self._end[node]
+        return self._chars[end - self._length[node] + 1:end + 1] if end >= 0 else []
+
+    def longest_suffix_palindrome_length(self):
+        """Length of the longest palindromic suffix of the text so far"""
+        return self._length[self._last]
+
+
+def count_distinct_palindromes(string):
+    """
+    Count the distinct non-empty palindromic substrings in O(n)
+
+    Args:
+        string (str or bytes): The input string
+
+    Returns:
+        int: The number of distinct palindromic substrings
+    """
+    tree = PalindromicTree()
+    tree.extend(string)
+    return len(tree)
+
+
+# Example usage
+if __name__ == "__main__":
+    for s in ["babad", "cbbd", "racecar", "banana", "xabay"]:
+        print(f"Longest palindromic substring in '{s}': '{longest_palindromic_substring(s)}'")
+
+    s = "abacaba"
+    odd, even = palindrome_radii(s)
+    print(f"Radii in '{s}': odd={odd}, even={even}")
+    print(f"Distinct palindromes in '{s}': {count_distinct_palindromes(s)}")
+
+    # Streaming mode
+    tree = PalindromicTree()
+    for char in "aabbaa":
+        tree.append(char)
+        print(f"After '{char}': {len(tree)} distinct, longest '{''.join(tree.longest_palindrome())}'")
@@ -0,0 +1,214 @@
+"""
+Problem Statement: Search Very Large Texts on Many Cores
+
+kmp_search and z_algorithm_pattern_matching scan the text on one core. A
+text can be split into chunks that are searched independently, as long as
+every match is found by exactly one chunk:
+
+- chunk i owns the start offsets [start_i, end_i) and reads the characters
+  [start_i, end_i + m - 1), so a match starting inside it is complete
+- a match is kept only if it starts before end_i, so the m - 1 overlapping
+  characters never produce duplicates
+- chunks are ordered and each chunk's matches are sorted, so concatenating
+  the per-chunk results gives the sorted list of all matches
+
+The text is never pickled. Files are memory-mapped by every worker, and
+in-memory texts are copied once into multiprocessing.shared_memory, which
+the workers attach to by name. Each task only carries offsets.
+
+Operations to implement:
+1. Split the text into overlapping chunks
+2. Run an existing matcher on every chunk in a process pool
+3. Merge the offsets in sorted order without duplicates
+
+Applications:
+- Scanning multi-GB logs and genomes
+- Batch keyword search on multi-core machines
+"""
+
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from strings.kmp import kmp_search
+from strings.z_algorithm import z_algorithm_pattern_matching
+
+# Matchers that can run on a chunk: name -> function(text, pattern) -> offsets
+MATCHERS = {
+    "kmp": lambda text, pattern: kmp_search(pattern, text),
+    "z": z_algorithm_pattern_matching,
+}
+
+# Chunks per worker, so uneven chunks still keep every worker busy
+CHUNKS_PER_WORKER = 4
+
+_STR_ENCODING = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def _search_chunk(task):
+    """
+    Search one chunk of a mapped file or shared memory block (runs in a worker)
+
+    Args:
+        task (tuple): (source kind, file path or shared memory name, text
+            length, bytes per character, chunk start, chunk end, pattern
+            bytes, matcher name)
+
+    Returns:
+        list: Absolute start offsets of the matches owned by the chunk
+    """
+    kind, name, length, itemsize, start, end, pattern, algorithm = task
+
+    if kind == "file":
+        with open(name, "rb") as f:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(source)
+    else:
+        source = shared_memory.SharedMemory(name=name)
+        buffer = source.buf
+
+    text = buffer[:length * itemsize]
+    pattern_view = memoryview(pattern)
+    if itemsize == 4:
+        # str texts are stored as UTF-32 code points
+        text = text.cast("I")
+        pattern_view = pattern_view.cast("I")
+
+    m = len(pattern_view)
+    chunk = text[start:min(end + m - 1, length)]
+    try:
+        matches = MATCHERS[algorithm](chunk, pattern_view)
+        return [start + offset for offset in matches if offset < end - start]
+    finally:
+        chunk.release()
+        text.release()
+        pattern_view.release()
+        buffer.release()
+        source.close()
+
+
+def _chunk_bounds(length, m, workers, chunk_size):
+    """
+    Split the possible match starts [0, length - m] into chunks
+
+    Returns:
+        list: (start, end) pairs covering the start offsets in order
+    """
+    starts = length - m + 1
+    if starts <= 0:
+        return []
+    if chunk_size is None:
+        chunk_size = -(-starts // (workers * CHUNKS_PER_WORKER))
+    chunk_size = max(chunk_size, 1)
+    return [(start, min(start + chunk_size, starts)) for start in range(0, starts, chunk_size)]
+
+
+def _run(kind, name, length, itemsize, pattern, algorithm, workers, chunk_size):
+    """Search every chunk, in a process pool unless a single worker is asked for"""
+    m = len(pattern) // itemsize
+    bounds = _chunk_bounds(length, m, workers, chunk_size)
+    tasks = [(kind, name, length, itemsize, start, end, pattern, algorithm) for start, end in bounds]
+
+    if workers == 1:
+        results = map(_search_chunk, tasks)
+        return [offset for chunk in results for offset in chunk]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_search_chunk, tasks)
+        return [offset for chunk in results for offset in chunk]
+
+
+def _encode_pattern(pattern, is_str):
+    if not pattern:
+        raise ValueError("pattern must be non-empty")
+    if isinstance(pattern, str) != is_str:
+        raise TypeError("pattern and text must both be str or both be bytes-like")
+    return pattern.encode(_STR_ENCODING) if is_str else bytes(pattern)
+
+
+def parallel_search_file(path, pattern, workers=None, algorithm="kmp", chunk_size=None):
+    """
+    Find all occurrences of a byte pattern in a file using a process pool
+
+    Every worker memory-maps the file itself, so nothing but offsets is
+    sent between processes.
+
+    Args:
+        path (str): The file to search in
+        pattern (bytes): The pattern to search for
+        workers (int, optional): Number of processes (default: CPU count)
+        algorithm (str): "kmp" or "z"
+        chunk_size (int, optional): Start offsets per task
+
+    Returns:
+        list: Sorted byte offsets where the pattern occurs
+    """
+    workers = workers or os.cpu_count() or 1
+    pattern = _encode_pattern(pattern, False)
+    length = os.path.getsize(path)
+    if length == 0:
+        return []
+    return _run("file", os.fspath(path), length, 1, pattern, algorithm, workers, chunk_size)
+
+
+def parallel_search(text, pattern, workers=None, algorithm="kmp", chunk_size=None):
+    """
+    Find all occurrences of a pattern in an in-memory text using a process pool
+
+    The text is copied once into a shared memory block (str texts as
+    UTF-32, so offsets stay character offsets) that the workers attach to.
+
+    Args:
+        text (str or bytes-like): The text to search in
+        pattern (str or bytes-like): The pattern to search for
+        workers (int, optional): Number of processes (default: CPU count)
+        algorithm (str): "kmp" or "z"
+        chunk_size (int, optional): Start offsets per task
+
+    Returns:
+        list: Sorted offsets where the pattern occurs
+    """
+    workers = workers or os.cpu_count() or 1
+    is_str = isinstance(text, str)
+    pattern = _encode_pattern(pattern, is_str)
+    data = text.encode(_STR_ENCODING) if is_str else memoryview(text).cast("B")
+    if len(data) == 0:
+        return []
+
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        block.buf[:len(data)] = data
+        itemsize = 4 if is_str else 1
+        return _run("shm", block.name, len(text), itemsize, pattern, algorithm, workers, chunk_size)
+    finally:
+        block.close()
+        block.unlink()
+
+
+# Benchmark: python -m strings.parallel_search [size in MB]
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+
+    size = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 4_000_000
+    pattern = b"ACGTTGCA"
+
+    random.seed(0)
+    data = bytes(random.choice(b"ACGT") for _ in range(size))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "text.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        print(f"Text: {size:,} bytes, pattern {pattern!r}, {os.cpu_count()} CPUs")
+        baseline = None
+        for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            matches = parallel_search_file(path, pattern, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"workers={workers:2d}: {elapsed:7.3f} s, speedup {baseline / elapsed:4.2f}x, {len(matches)} matches")
@@ -0,0 +1,212 @@
+"""
+Problem Statement: Implement a Rolling-Hash (Rabin-Karp) Substring Index
+
+A polynomial hash maps a string s to
+    H(s) = s[0]·B^(k-1) + s[1]·B^(k-2) + ... + s[k-1]   (mod P)
+With the hashes of all prefixes and the powers of B precomputed, the hash of
+any substring is
+    H(s[i:j]) = prefix[j] - prefix[i]·B^(j-i)   (mod P)
+in O(1), so two substrings can be compared for equality in O(1) (equal
+strings always have equal hashes; different strings collide with probability
+about k/P for a random base B). The longest common prefix of two suffixes
+is then found by binary search over its length in O(log n).
+
+The modulus is the Mersenne prime P = 2^61 - 1, so hashes fit in 64-bit
+array slots and collisions are negligible even for very long texts, and the
+base is chosen at random so no fixed input can be made to collide.
+
+Operations to implement:
+1. Build prefix hashes and powers of the base for a text
+2. Compare two substrings in O(1)
+3. Find the LCP of two suffixes in O(log n)
+4. Rabin-Karp search for many patterns of the same length in one pass
+
+Applications:
+- Substring comparison in suffix array and string algorithms
+- Plagiarism detection (many patterns of the same length)
+- Duplicate detection
+"""
+
+import random
+from array import array
+
+# Mersenne prime modulus 2^61 - 1
+MOD = (1 << 61) - 1
+
+
+def _codes(text):
+    """Iterate over the character codes of a str or bytes-like text"""
+    return map(ord, text) if isinstance(text, str) else iter(text)
+
+
+class RollingHash:
+    """Prefix-hash index of a text (mod 2^61 - 1)"""
+
+    def __init__(self, text, base=None):
+        """
+        Precompute the prefix hashes and the powers of the base
+
+        Args:
+            text (str or bytes-like): The text to index
+            base (int, optional): Hash base; random if not given. Use the
+                same base to compare hashes of different texts.
+        """
+        self.text = text
+        self.base = base if base is not None else random.randrange(1 << 20, MOD - 1)
+
+        n = len(text)
+        prefix = array('Q', [0]) * (n + 1)
+        powers = array('Q', [1]) * (n + 1)
+
+        h = 0
+        p = 1
+        for i, code in enumerate(_codes(text), 1):
+            h = (h * self.base + code) % MOD
+            p = p * self.base % MOD
+            prefix[i] = h
+            powers[i] = p
+
+        self.prefix = prefix
+        self.powers = powers
+
+    def __len__(self):
+        return len(self.prefix) - 1
+
+    def hash(self, start, length):
+        """
+        Hash of text[start:start + length] in O(1)
+
+        Args:
+            start (int): Start of the substring
+            length (int): Length of the substring
+
+        Returns:
+            int: The hash value
+        """
+        return (self.prefix[start + length] - self.prefix[start] * self.powers[length]) % MOD
+
+    def hash_of(self, sequence):
+        """
+        Hash of another sequence with this index's base, e.g. a pattern
+
+        Args:
+            sequence (str or bytes-like): The sequence to hash
+
+        Returns:
+            int: The hash value, comparable with hash()
+        """
+        h = 0
+        for code in _codes(sequence):
+            h = (h * self.base + code) % MOD
+        return h
+
+    def equal(self, i, j, length):
+        """
+        Check whether text[i:i + length] == text[j:j + length] in O(1)
+
+        Args:
+            i (int): Start of the first substring
+            j (int): Start of the second substring
+            length (int): Length of both substrings
+
+        Returns:
+            bool: True if the hashes (and so, with high probability, the
+            substrings) are equal
+        """
+        return self.hash(i, length) == self.hash(j, length)
+
+    def lcp(self, i, j):
+        """
+        Length of the longest common prefix of the suffixes at i and j,
+        by binary search over the length (O(log n))
+
+        Args:
+            i (int): Start of the first suffix
+            j (int): Start of the second suffix
+
+        Returns:
+            int: Length of the longest common prefix
+        """
+        n = len(self)
+        low, high = 0, n - max(i, j)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.equal(i, j, mid):
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    def compare_suffixes(self, i, j):
+        """
+        Compare the suffixes at i and j in O(log n)
+
+        Args:
+            i (int): Start of the first suffix
+            j (int): Start of the second suffix
+
+        Returns:
+            int: -1, 0 or 1 as text[i:] is smaller, equal or larger
+        """
+        if i == j:
+            return 0
+        k = self.lcp(i, j)
+        n = len(self)
+        if i + k == n:
+            return -1
+        if j + k == n:
+            return 1
+        return -1 if self.text[i + k] < self.text[j + k] else 1
+
+
+def rabin_karp_search(text, patterns, rolling_hash=None):
+    """
+    Find all occurrences of many patterns of the same length in one pass
+
+    Every window of the text is hashed in O(1) and looked up in a table of
+    pattern hashes; hits are confirmed by a direct comparison.
+
+    Args:
+        text (str or bytes-like): The text to search in
+        patterns (iterable): Patterns, all of the same length
+        rolling_hash (RollingHash, optional): An existing index of the text
+
+    Returns:
+        dict: Pattern -> list of indices where it occurs in the text
+    """
+    patterns = list(dict.fromkeys(patterns))
+    result = {pattern: [] for pattern in patterns}
+    if not patterns:
+        return result
+
+    m = len(patterns[0])
+    if m == 0 or any(len(pattern) != m for pattern in patterns):
+        raise ValueError("patterns must be non-empty and of the same length")
+
+    index = rolling_hash if rolling_hash is not None else RollingHash(text)
+
+    by_hash = {}
+    for pattern in patterns:
+        by_hash.setdefault(index.hash_of(pattern), []).append(pattern)
+
+    for start in range(len(text) - m + 1):
+        candidates = by_hash.get(index.hash(start, m))
+        if candidates is not None:
+            window = text[start:start + m]
+            for pattern in candidates:
+                if window == pattern:
+                    result[pattern].append(start)
+
+    return result
+
+
+# Example usage
+if __name__ == "__main__":
+    text = "abracadabra"
+    index = RollingHash(text)
+
+    print(f"Text: {text}")
+    print(f"text[0:4] == text[7:11]: {index.equal(0, 7, 4)}")  # True ('abra')
+    print(f"LCP of suffixes at 0 and 7: {index.lcp(0, 7)}")  # 4
+    print(f"LCP of suffixes at 1 and 8: {index.lcp(1, 8)}")  # 3
+    print(f"Matches: {rabin_karp_search(text, ['abr', 'cad', 'xyz'], index)}")
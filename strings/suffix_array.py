@@ -14,6 +14,9 @@ For example, for the string "banana":
 Operations to implement:
 1. Build a suffix array for a given string
 2. Search for a pattern in the string using the suffix array (binary search)
+3. Build the LCP array (Kasai) and use it to speed up the search
+4. Save the index to disk and memory-map it back for zero-copy searches
+5. Index many documents at once (generalized suffix array)
 
 Applications:
 - Pattern matching
@@ -22,6 +25,13 @@ Applications:
 - Bioinformatics (DNA sequence analysis)
 """
 
+import mmap
+import struct
+import sys
+from array import array
+from collections import deque
+
+
 def build_suffix_array_naive(text):
     """
     Build a suffix array for the given text using a naive approach (O(n²log(n)) time complexity)
@@ -46,82 +56,412 @@ def build_suffix_array_naive(text):
     return suffix_array
 
 
-def build_suffix_array(text):
+def _sa_is(s, upper):
     """
-    Build a suffix array for the given text using a more efficient approach
-    This is a simplified implementation of the algorithm
-    
+    Build the suffix array of an integer sequence with the SA-IS algorithm
+    (induced sorting, O(n) time)
+
     Args:
-        text (str): The input string
-        
+        s (list): The input sequence, every value in the range [0, upper]
+        upper (int): The largest value that may appear in the sequence
+
     Returns:
         list: The suffix array
     """
-    # For simplicity, we'll use the naive approach
-    # In practice, more efficient algorithms like SA-IS or DC3 would be used
-    return build_suffix_array_naive(text)
+    n = len(s)
+    if n == 0:
+        return []
+    if n == 1:
+        return [0]
+    if n == 2:
+        return [0, 1] if s[0] < s[1] else [1, 0]
+
+    sa = [0] * n
+
+    # Classify every position as S-type (True) or L-type (False)
+    ls = [False] * n
+    for i in range(n - 2, -1, -1):
+        ls[i] = ls[i + 1] if s[i] == s[i + 1] else s[i] < s[i + 1]
+
+    # Bucket boundaries: sum_l[c] is where the L-type bucket of c starts,
+    # sum_s[c] is where the S-type bucket of c starts
+    sum_l = [0] * (upper + 1)
+    sum_s = [0] * (upper + 1)
+    for i in range(n):
+        if not ls[i]:
+            sum_s[s[i]] += 1
+        else:
+            sum_l[s[i] + 1] += 1
+    for i in range(upper + 1):
+        sum_s[i] += sum_l[i]
+        if i < upper:
+            sum_l[i + 1] += sum_s[i]
+
+    def induce(lms):
+        for i in range(n):
+            sa[i] = -1
+
+        # Place the LMS suffixes at the start of their S buckets
+        buf = sum_s[:]
+        for d in lms:
+            if d == n:
+                continue
+            sa[buf[s[d]]] = d
+            buf[s[d]] += 1
+
+        # Induce the L-type suffixes from left to right
+        buf = sum_l[:]
+        sa[buf[s[n - 1]]] = n - 1
+        buf[s[n - 1]] += 1
+        for i in range(n):
+            v = sa[i]
+            if v >= 1 and not ls[v - 1]:
+                sa[buf[s[v - 1]]] = v - 1
+                buf[s[v - 1]] += 1
+
+        # Induce the S-type suffixes from right to left
+        buf = sum_l[:]
+        for i in range(n - 1, -1, -1):
+            v = sa[i]
+            if v >= 1 and ls[v - 1]:
+                buf[s[v - 1] + 1] -= 1
+                sa[buf[s[v - 1] + 1]] = v - 1
+
+    # Leftmost S-type (LMS) positions
+    lms_map = [-1] * (n + 1)
+    lms = []
+    for i in range(1, n):
+        if not ls[i - 1] and ls[i]:
+            lms_map[i] = len(lms)
+            lms.append(i)
+    m = len(lms)
+
+    induce(lms)
+
+    if m:
+        # Name the LMS substrings in sorted order and sort them recursively
+        sorted_lms = [v for v in sa if lms_map[v] != -1]
+        rec_s = [0] * m
+        rec_upper = 0
+        rec_s[lms_map[sorted_lms[0]]] = 0
+        for i in range(1, m):
+            left = sorted_lms[i - 1]
+            right = sorted_lms[i]
+            end_l = lms[lms_map[left] + 1] if lms_map[left] + 1 < m else n
+            end_r = lms[lms_map[right] + 1] if lms_map[right] + 1 < m else n
+            same = True
+            if end_l - left != end_r - right:
+                same = False
+            else:
+                while left < end_l:
+                    if s[left] != s[right]:
+                        break
+                    left += 1
+                    right += 1
+                if left == n or s[left] != s[right]:
+                    same = False
+            if not same:
+                rec_upper += 1
+            rec_s[lms_map[sorted_lms[i]]] = rec_upper
+
+        rec_sa = _sa_is(rec_s, rec_upper)
+
+        for i in range(m):
+            sorted_lms[i] = lms[rec_sa[i]]
+        induce(sorted_lms)
+
+    return sa
+
+
+def _to_codes(text):
+    """
+    Map a str or bytes-like text to a list of small integer codes that
+    preserve the character order
+
+    Args:
+        text (str or bytes): The input text
+
+    Returns:
+        tuple: (codes, upper) where upper is the largest possible code
+    """
+    if isinstance(text, str):
+        alphabet = sorted(set(text))
+        rank = {char: code for code, char in enumerate(alphabet)}
+        return [rank[char] for char in text], max(len(alphabet) - 1, 0)
+
+    # bytes, bytearray and memoryview index to ints in [0, 255]
+    return list(text), 255
+
+
+def build_suffix_array(text):
+    """
+    Build a suffix array for the given text using the SA-IS algorithm
+    (O(n) time and memory)
+
+    Use build_suffix_array_naive as a reference implementation to check
+    the result against.
+
+    Args:
+        text (str or bytes): The input string
+
+    Returns:
+        array: The suffix array as a compact array('i')
+    """
+    codes, upper = _to_codes(text)
+    return array('i', _sa_is(codes, upper))
+
+
+def build_inverse_suffix_array(suffix_array):
+    """
+    Build the inverse suffix array (the rank of every suffix)
+
+    Args:
+        suffix_array (array): The suffix array of the text
+
+    Returns:
+        array: rank such that suffix_array[rank[i]] == i
+    """
+    rank = array('i', [0]) * len(suffix_array)
+    for r, start in enumerate(suffix_array):
+        rank[start] = r
+    return rank
+
+
+def build_lcp_array(text, suffix_array):
+    """
+    Build the LCP array with Kasai's algorithm (O(n) time)
 
+    lcp[i] is the length of the longest common prefix of the suffixes at
+    suffix_array[i - 1] and suffix_array[i]; lcp[0] is 0.
 
-def search_pattern(text, pattern, suffix_array):
+    Args:
+        text (str or bytes): The input string
+        suffix_array (array): The suffix array of the text
+
+    Returns:
+        array: The LCP array as an array('i')
+    """
+    n = len(text)
+    rank = build_inverse_suffix_array(suffix_array)
+    lcp = array('i', [0]) * n
+
+    # The LCP of consecutive text positions drops by at most one,
+    # so h never has to restart from zero
+    h = 0
+    for i in range(n):
+        r = rank[i]
+        if r == 0:
+            h = 0
+            continue
+        j = suffix_array[r - 1]
+        while i + h < n and j + h < n and text[i + h] == text[j + h]:
+            h += 1
+        lcp[r] = h
+        if h > 0:
+            h -= 1
+
+    return lcp
+
+
+def build_lcp_lr_arrays(lcp_array):
+    """
+    Precompute the LCP of the left/right boundaries of every binary search
+    interval (Manber-Myers), so search_pattern never re-compares characters
+    it already knows to match
+
+    For every midpoint M of the implicit binary search over [0, n - 1],
+    llcp[M] is the LCP of the suffixes at ranks L and M, and rlcp[M] the
+    LCP of the suffixes at ranks M and R.
+
+    Args:
+        lcp_array (array): The LCP array of the text
+
+    Returns:
+        tuple: (llcp, rlcp) as two array('i')
+    """
+    n = len(lcp_array)
+    llcp = array('i', [0]) * n
+    rlcp = array('i', [0]) * n
+
+    def fill(left, right):
+        if right - left == 1:
+            return lcp_array[right]
+        mid = (left + right) // 2
+        llcp[mid] = fill(left, mid)
+        rlcp[mid] = fill(mid, right)
+        return min(llcp[mid], rlcp[mid])
+
+    if n > 1:
+        fill(0, n - 1)
+
+    return llcp, rlcp
+
+
+def _extend_match(text, start, pattern, k):
+    """
+    Extend a known common prefix of length k between text[start:] and the
+    pattern, comparing one character at a time
+
+    Returns:
+        int: The length of the common prefix
+    """
+    n = len(text)
+    m = len(pattern)
+    while k < m and start + k < n and text[start + k] == pattern[k]:
+        k += 1
+    return k
+
+
+def _search_pattern_lcp(text, pattern, suffix_array, lcp_array, llcp, rlcp):
+    """
+    Manber-Myers search: O(m + log n) character comparisons to find the
+    first matching suffix, then the LCP array to walk the remaining ones
+    """
+    n = len(text)
+    m = len(pattern)
+
+    if n == 0:
+        return []
+    if m == 0:
+        return list(suffix_array)
+
+    # The suffix at rank R is >= pattern (compared on its first m chars),
+    # and the suffix at rank L is < pattern; l and r are their LCPs with it
+    first = suffix_array[0]
+    l = _extend_match(text, first, pattern, 0)
+    if l == m or (first + l < n and text[first + l] > pattern[l]):
+        lower_bound = 0
+        matched = l == m
+    else:
+        last = suffix_array[n - 1]
+        r = _extend_match(text, last, pattern, 0)
+        if r < m and (last + r == n or text[last + r] < pattern[r]):
+            return []
+
+        left, right = 0, n - 1
+        while right - left > 1:
+            mid = (left + right) // 2
+
+            if l >= r:
+                if llcp[mid] > l:
+                    left = mid
+                    continue
+                if llcp[mid] < l:
+                    right = mid
+                    r = llcp[mid]
+                    continue
+                k = l
+            else:
+                if rlcp[mid] > r:
+                    right = mid
+                    continue
+                if rlcp[mid] < r:
+                    left = mid
+                    l = rlcp[mid]
+                    continue
+                k = r
+
+            # Only compare past the prefix that is already known to match
+            suffix_start = suffix_array[mid]
+            k = _extend_match(text, suffix_start, pattern, k)
+            if k == m or (suffix_start + k < n and text[suffix_start + k] > pattern[k]):
+                right = mid
+                r = k
+            else:
+                left = mid
+                l = k
+
+        lower_bound = right
+        matched = r == m
+
+    if not matched:
+        return []
+
+    # All further occurrences are adjacent and share at least m characters
+    upper_bound = lower_bound + 1
+    while upper_bound < n and lcp_array[upper_bound] >= m:
+        upper_bound += 1
+
+    return [suffix_array[i] for i in range(lower_bound, upper_bound)]
+
+
+def search_pattern(text, pattern, suffix_array, lcp_array=None, lcp_lr=None):
     """
     Search for a pattern in the text using the suffix array (binary search)
-    
+
+    When an LCP array is given, the search uses the Manber-Myers LCP-LR
+    method and runs in O(m + log n + occ) without slicing the text. It
+    needs the LCP-LR arrays too, built once with build_lcp_lr_arrays and
+    reused across queries.
+
     Args:
         text (str): The input string
         pattern (str): The pattern to search for
         suffix_array (list): The suffix array of the text
-        
+        lcp_array (array, optional): The LCP array of the text
+        lcp_lr (tuple, optional): The (llcp, rlcp) arrays of the text,
+            required with lcp_array
+
     Returns:
         list: Indices where the pattern occurs in the text
+
+    Raises:
+        ValueError: If lcp_array is given without lcp_lr
     """
+    if lcp_array is not None:
+        if lcp_lr is None:
+            raise ValueError("lcp_lr is required with lcp_array; build it once with build_lcp_lr_arrays")
+        llcp, rlcp = lcp_lr
+        return _search_pattern_lcp(text, pattern, suffix_array, lcp_array, llcp, rlcp)
+
     n = len(text)
     m = len(pattern)
-    result = []
     
-    # Binary search for the lower bound
-    left, right = 0, n - 1
-    while left <= right:
+    # Binary search for the lower bound: the first suffix that is not
+    # smaller than the pattern. Characters are compared in place (no
+    # slices), so this also works on memoryviews of a mapped index, and
+    # the shorter of the two boundary LCPs is known to match already.
+    left, right = 0, n
+    left_lcp = right_lcp = 0
+    while left < right:
         mid = (left + right) // 2
         suffix_start = suffix_array[mid]
         
         # Compare the pattern with the suffix
-        suffix = text[suffix_start:suffix_start + m]
+        k = _extend_match(text, suffix_start, pattern, min(left_lcp, right_lcp))
         
-        if pattern > suffix:
+        if k < m and (suffix_start + k == n or text[suffix_start + k] < pattern[k]):
             left = mid + 1
+            left_lcp = k
         else:
-            right = mid - 1
+            right = mid
+            right_lcp = k
     
-    # Lower bound
+    # right_lcp belongs to the suffix at the lower bound (or is 0 at n)
     lower_bound = left
+    if lower_bound == n or right_lcp < m:
+        return []
     
-    # Binary search for the upper bound
-    left, right = 0, n - 1
-    while left <= right:
+    # Binary search for the upper bound: the first suffix past the lower
+    # bound that does not start with the pattern. The lower bound matches
+    # all m characters, so the same boundary LCP trick applies.
+    left, right = lower_bound + 1, n
+    left_lcp, right_lcp = m, 0
+    while left < right:
         mid = (left + right) // 2
-        suffix_start = suffix_array[mid]
+        k = _extend_match(text, suffix_array[mid], pattern, min(left_lcp, right_lcp))
         
-        # Compare the pattern with the suffix
-        suffix = text[suffix_start:suffix_start + min(m, n - suffix_start)]
-        
-        if pattern < suffix:
-            right = mid - 1
-        else:
+        if k == m:
             left = mid + 1
+            left_lcp = k
+        else:
+            right = mid
+            right_lcp = k
     
-    # Upper bound
-    upper_bound = right
-    
-    # Collect all occurrences
-    for i in range(lower_bound, upper_bound + 1):
-        suffix_start = suffix_array[i]
-        if text[suffix_start:suffix_start + m] == pattern:
-            result.append(suffix_start)
-    
-    return result
+    return list(suffix_array[lower_bound:left])
 
 
-def longest_common_prefix(text, i, j, suffix_array):
+def longest_common_prefix(text, i, j, suffix_array, rolling_hash=None):
     """
     Find the length of the longest common prefix between two suffixes
     
@@ -130,6 +470,9 @@ def longest_common_prefix(text, i, j, suffix_array):
         i (int): Index of the first suffix in the suffix array
         j (int): Index of the second suffix in the suffix array
         suffix_array (list): The suffix array of the text
+        rolling_hash (RollingHash, optional): A prefix-hash index of the
+            text (strings.rolling_hash) to answer in O(log n) instead of
+            comparing characters one at a time
         
     Returns:
         int: Length of the longest common prefix
@@ -138,6 +481,9 @@ def longest_common_prefix(text, i, j, suffix_array):
     a = suffix_array[i]
     b = suffix_array[j]
     
+    if rolling_hash is not None:
+        return rolling_hash.lcp(a, b)
+    
     lcp = 0
     while a + lcp < n and b + lcp < n and text[a + lcp] == text[b + lcp]:
         lcp += 1
@@ -145,10 +491,152 @@ def longest_common_prefix(text, i, j, suffix_array):
     return lcp
 
 
+class GeneralizedSuffixArray:
+    """
+    Suffix array over many documents
+
+    The documents are concatenated with one separator per document. Each
+    separator gets its own code below every character code, so no common
+    prefix can run across a document boundary, whatever characters the
+    documents contain. doc_ids maps every position of the concatenation to
+    its document and doc_starts gives each document's first position.
+    """
+
+    def __init__(self, documents):
+        """
+        Build the suffix array, LCP array and document maps
+
+        Args:
+            documents (iterable): The documents, all str or all bytes-like
+        """
+        self.documents = list(documents)
+        num_docs = len(self.documents)
+
+        alphabet = sorted({char for document in self.documents for char in document})
+        self._codes_of = {char: code for code, char in enumerate(alphabet, num_docs)}
+
+        codes = []
+        self.doc_ids = array('i')
+        self.doc_starts = array('i')
+        for doc, document in enumerate(self.documents):
+            self.doc_starts.append(len(codes))
+            codes.extend(self._codes_of[char] for char in document)
+            codes.append(doc)
+            self.doc_ids.extend(array('i', [doc]) * (len(document) + 1))
+
+        self.text = array('i', codes)
+        self.suffix_array = array('i', _sa_is(codes, num_docs + len(alphabet)))
+        self.lcp_array = build_lcp_array(self.text, self.suffix_array)
+        self.lcp_lr = build_lcp_lr_arrays(self.lcp_array)
+
+    def search(self, pattern):
+        """
+        Find every occurrence of a pattern in every document
+
+        Args:
+            pattern (str or bytes): The pattern to search for
+
+        Returns:
+            list: Sorted (doc, offset) pairs
+        """
+        codes = [self._codes_of.get(char, -1) for char in pattern]
+        if -1 in codes:
+            return []
+
+        positions = search_pattern(self.text, codes, self.suffix_array, self.lcp_array, self.lcp_lr)
+        result = []
+        for position in positions:
+            doc = self.doc_ids[position]
+            offset = position - self.doc_starts[doc]
+            # Only the empty pattern matches at a separator
+            if offset < len(self.documents[doc]):
+                result.append((doc, offset))
+        result.sort()
+        return result
+
+    def document_frequency(self, pattern):
+        """
+        Count the documents that contain a pattern
+
+        Args:
+            pattern (str or bytes): The pattern to search for
+
+        Returns:
+            int: Number of distinct documents containing the pattern
+        """
+        return len({doc for doc, _ in self.search(pattern)})
+
+    def longest_common_substring(self, k=None):
+        """
+        Find the longest substring shared by at least k documents
+
+        A window of consecutive suffix array ranks whose suffixes come from
+        at least k documents shares a prefix of length min(LCP in the window);
+        a sliding window with a monotonic deque finds the best one in O(n).
+
+        Args:
+            k (int, optional): Minimum number of documents (default: all)
+
+        Returns:
+            str or bytes: The longest common substring ("" if none)
+        """
+        num_docs = len(self.documents)
+        k = num_docs if k is None else k
+        if num_docs == 0 or k > num_docs:
+            return self.documents[0][:0] if self.documents else ""
+        if k <= 1:
+            return max(self.documents, key=len)
+
+        suffix_array = self.suffix_array
+        lcp = self.lcp_array
+        doc_ids = self.doc_ids
+
+        # The first num_docs ranks are the separator suffixes
+        counts = [0] * num_docs
+        distinct = 0
+        window_min = deque()
+        best_length, best_position = 0, 0
+        low = num_docs
+
+        for high in range(num_docs, len(suffix_array)):
+            doc = doc_ids[suffix_array[high]]
+            if counts[doc] == 0:
+                distinct += 1
+            counts[doc] += 1
+
+            if high > low:
+                while window_min and lcp[window_min[-1]] >= lcp[high]:
+                    window_min.pop()
+                window_min.append(high)
+
+            # Shrink from the left while the window keeps at least k documents
+            while low < high:
+                doc = doc_ids[suffix_array[low]]
+                if counts[doc] == 1 and distinct <= k:
+                    break
+                counts[doc] -= 1
+                if counts[doc] == 0:
+                    distinct -= 1
+                low += 1
+                while window_min and window_min[0] <= low:
+                    window_min.popleft()
+
+            if distinct >= k and window_min and lcp[window_min[0]] > best_length:
+                best_length = lcp[window_min[0]]
+                best_position = suffix_array[high]
+
+        doc = doc_ids[best_position]
+        offset = best_position - self.doc_starts[doc]
+        return self.documents[doc][offset:offset + best_length]
+
+
 def longest_common_substring(str1, str2):
     """
     Find the longest common substring between two strings using suffix arrays
     
+    The strings are indexed as two documents of a generalized suffix array,
+    so no separator character has to be absent from them.
+    
     Args:
         str1 (str): First string
         str2 (str): Second string
@@ -156,35 +644,166 @@ def longest_common_substring(str1, str2):
     Returns:
         str: The longest common substring
     """
-    # Concatenate the strings with a unique separator
-    combined = str1 + "#" + str2
-    n = len(combined)
-    
-    # Build the suffix array
-    suffix_array = build_suffix_array(combined)
-    
-    # Find the longest common prefix between adjacent suffixes
-    max_length = 0
-    max_index = 0
-    
-    for i in range(1, n):
-        # Check if the adjacent suffixes come from different strings
-        curr_suffix = suffix_array[i]
-        prev_suffix = suffix_array[i - 1]
-        
-        # One suffix is from str1 and the other is from str2
-        if (curr_suffix < len(str1)) != (prev_suffix < len(str1)):
-            lcp_length = longest_common_prefix(combined, i - 1, i, suffix_array)
-            
-            if lcp_length > max_length:
-                max_length = lcp_length
-                max_index = min(curr_suffix, prev_suffix)
-    
-    # Return the longest common substring
-    if max_length == 0:
-        return ""
+    return GeneralizedSuffixArray([str1, str2]).longest_common_substring()
+
+
+# On-disk index layout: a 24 byte header followed by the text and the int32
+# arrays, each padded to a multiple of 8 bytes so that every section starts
+# 8 byte aligned and can be viewed in place
+_INDEX_MAGIC = b"DSASAIX1"
+_INDEX_HEADER = struct.Struct("<8sBBB5xQ")
+_TEXT_BYTES = 0
+_TEXT_STR = 1
+
+
+def _pad8(size):
+    return (size + 7) & ~7
+
+
+def _native_utf32():
+    return "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def save_suffix_array_index(path, text, suffix_array, lcp_array=None):
+    """
+    Save the text, its suffix array and (optionally) its LCP array to a
+    binary index file that load_suffix_array_index can memory-map
+
+    str text is stored as native-endian UTF-32 so that suffix array offsets
+    stay character offsets; bytes-like text is stored as is.
+
+    Args:
+        path (str): The file to write
+        text (str or bytes): The input string
+        suffix_array (array): The suffix array of the text
+        lcp_array (array, optional): The LCP array of the text
+    """
+    if isinstance(text, str):
+        kind = _TEXT_STR
+        text_bytes = text.encode(_native_utf32())
     else:
-        return combined[max_index:max_index + max_length]
+        kind = _TEXT_BYTES
+        text_bytes = bytes(text)
+
+    sections = [array('i', suffix_array)]
+    if lcp_array is not None:
+        lcp_array = array('i', lcp_array)
+        llcp, rlcp = build_lcp_lr_arrays(lcp_array)
+        sections.extend([lcp_array, llcp, rlcp])
+
+    byteorder = 0 if sys.byteorder == "little" else 1
+    with open(path, "wb") as f:
+        f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, kind, lcp_array is not None, byteorder, len(text)))
+        f.write(text_bytes)
+        f.write(b"\0" * (_pad8(len(text_bytes)) - len(text_bytes)))
+        for section in sections:
+            section.tofile(f)
+            size = len(section) * section.itemsize
+            f.write(b"\0" * (_pad8(size) - size))
+
+
+class SuffixArrayIndex:
+    """
+    A suffix array index memory-mapped from a file written by
+    save_suffix_array_index
+
+    text, suffix_array, lcp_array and lcp_lr are memoryviews over the
+    mapping, so loading costs no parsing or copying and processes that map
+    the same file share its page cache. They can be passed straight to
+    search_pattern (for str indexes, text holds code points; use search).
+    """
+
+    def __init__(self, path):
+        """
+        Map an index file
+
+        Args:
+            path (str): The file written by save_suffix_array_index
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        if len(self._buffer) < _INDEX_HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a suffix array index")
+        magic, kind, has_lcp, byteorder, n = _INDEX_HEADER.unpack_from(self._buffer)
+        if magic != _INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a suffix array index")
+        if byteorder != (0 if sys.byteorder == "little" else 1):
+            self.close()
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+
+        self.is_str = kind == _TEXT_STR
+        text_size = n * 4 if self.is_str else n
+        expected = _INDEX_HEADER.size + _pad8(text_size) + _pad8(4 * n) * (4 if has_lcp else 1)
+        size = len(self._buffer)
+        if size < expected:
+            self.close()
+            raise ValueError(f"{path} is truncated: {size} bytes, expected {expected}")
+
+        offset = _INDEX_HEADER.size
+        self.text = self._buffer[offset:offset + text_size]
+        if self.is_str:
+            self.text = self.text.cast("I")
+        offset += _pad8(text_size)
+
+        def int_section():
+            nonlocal offset
+            section = self._buffer[offset:offset + 4 * n].cast("i")
+            offset += _pad8(4 * n)
+            return section
+
+        self.suffix_array = int_section()
+        self.lcp_array = None
+        self.lcp_lr = None
+        if has_lcp:
+            self.lcp_array = int_section()
+            self.lcp_lr = (int_section(), int_section())
+
+    def search(self, pattern):
+        """
+        Search for a pattern directly in the mapped buffers
+
+        Args:
+            pattern (str or bytes): The pattern to search for
+
+        Returns:
+            list: Indices where the pattern occurs in the text
+        """
+        if self.is_str:
+            pattern = memoryview(pattern.encode(_native_utf32())).cast("I")
+        return search_pattern(self.text, pattern, self.suffix_array, self.lcp_array, self.lcp_lr)
+
+    def close(self):
+        """Release the buffers and unmap the file"""
+        views = [self.__dict__.get(name) for name in ("text", "suffix_array", "lcp_array")]
+        views.extend(self.__dict__.get("lcp_lr") or ())
+        for view in views:
+            if view is not None:
+                view.release()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def load_suffix_array_index(path):
+    """
+    Memory-map a suffix array index file
+
+    Args:
+        path (str): The file written by save_suffix_array_index
+
+    Returns:
+        SuffixArrayIndex: The mapped index
+    """
+    return SuffixArrayIndex(path)
 
 
 # Example usage
@@ -194,12 +813,17 @@ if __name__ == "__main__":
     # Build the suffix array
     suffix_array = build_suffix_array(text)
     print(f"Text: {text}")
-    print(f"Suffix Array: {suffix_array}")
+    print(f"Suffix Array: {list(suffix_array)}")
+    
+    # Build the LCP array
+    lcp_array = build_lcp_array(text, suffix_array)
+    lcp_lr = build_lcp_lr_arrays(lcp_array)
+    print(f"LCP Array: {list(lcp_array)}")
     
     # Search for patterns
     patterns = ["ana", "nan", "an", "xyz"]
     for pattern in patterns:
-        occurrences = search_pattern(text, pattern, suffix_array)
+        occurrences = search_pattern(text, pattern, suffix_array, lcp_array, lcp_lr)
         if occurrences:
             print(f"Pattern '{pattern}' found at positions: {occurrences}")
         else:
@@ -210,3 +834,21 @@ if __name__ == "__main__":
     str2 = "bcdefxy"
     lcs = longest_common_substring(str1, str2)
     print(f"Longest common substring between '{str1}' and '{str2}': '{lcs}'")
+    
+    # Index several documents at once
+    documents = ["a#banana", "bandana#", "cabana"]
+    gsa = GeneralizedSuffixArray(documents)
+    print(f"'ana' occurs at (doc, offset): {gsa.search('ana')}")
+    print(f"'ban' occurs in {gsa.document_frequency('ban')} documents")
+    print(f"Longest substring in all documents: '{gsa.longest_common_substring()}'")
+    print(f"Longest substring in 2 of 3 documents: '{gsa.longest_common_substring(2)}'")
+    
+    # Save the index and search the memory-mapped copy
+    import os
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "banana.sa")
+        save_suffix_array_index(path, text, suffix_array, lcp_array)
+        with load_suffix_array_index(path) as index:
+            print(f"Pattern 'ana' found in the mapped index at positions: {index.search('ana')}")
@@ -13,6 +13,7 @@ Operations to implement:
 2. Search for a word in the trie
 3. Check if a prefix exists in the trie
 4. Delete a word from the trie (optional)
+5. Suggest the top-k scored words for a prefix (WeightedTrie)
 
 Applications:
 - Autocomplete features
@@ -21,6 +22,11 @@ Applications:
 - Predictive text
 """
 
+from bisect import bisect_left, insort
+from heapq import heappop, heappush, merge
+from itertools import count, islice
+
+
 class TrieNode:
     """A node in the trie structure"""
     
@@ -36,9 +42,12 @@ class TrieNode:
 class Trie:
     """Trie data structure implementation"""
     
+    # Node type created for every character; subclasses can extend TrieNode
+    node_class = TrieNode
+    
     def __init__(self):
         """Initialize the trie with an empty root node"""
-        self.root = TrieNode()
+        self.root = self.node_class()
     
     def insert(self, word):
         """
@@ -54,7 +63,7 @@ class Trie:
             # If the character is not found in the current node's children,
             # add a new node for this character
             if char not in node.children:
-                node.children[char] = TrieNode()
+                node.children[char] = self.node_class()
             
             # Move to the child node
             node = node.children[char]
@@ -112,6 +121,59 @@ class Trie:
         # If we've traversed all characters in the prefix, return True
         return True
     
+    def _find_node(self, prefix):
+        """
+        Find the node reached by following the prefix from the root
+        
+        Args:
+            prefix (str): The prefix to follow
+            
+        Returns:
+            TrieNode: The node, or None if the prefix is not in the trie
+        """
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+    
+    def iter_words_with_prefix(self, prefix):
+        """
+        Lazily yield all words in the trie that start with the given prefix
+        
+        The traversal uses an explicit stack, so deep tries do not hit the
+        recursion limit, and each word is joined once from a shared path
+        instead of building a new string at every level.
+        
+        Args:
+            prefix (str): The prefix to search for
+            
+        Yields:
+            str: Words that start with the given prefix, in DFS order
+        """
+        node = self._find_node(prefix)
+        if node is None:
+            return
+        
+        path = list(prefix)
+        if node.is_end_of_word:
+            yield prefix
+        
+        # Each entry is (length of the path above the child, char, child)
+        base = len(path)
+        stack = [(base, char, child) for char, child in reversed(node.children.items())]
+        while stack:
+            depth, char, node = stack.pop()
+            del path[depth:]
+            path.append(char)
+            
+            if node.is_end_of_word:
+                yield "".join(path)
+            
+            for child_char, child in reversed(node.children.items()):
+                stack.append((depth + 1, child_char, child))
+    
     def get_words_with_prefix(self, prefix):
         """
         Get all words in the trie that start with the given prefix
@@ -122,33 +184,162 @@ class Trie:
         Returns:
             list: A list of words that start with the given prefix
         """
-        result = []
-        node = self.root
+        return list(self.iter_words_with_prefix(prefix))
+
+
+class WeightedTrieNode(TrieNode):
+    """A trie node that caches the best-scoring words below it"""
+    
+    def __init__(self):
+        super().__init__()
         
-        # Traverse to the node corresponding to the prefix
-        for char in prefix:
+        # Score of the word ending here (set when is_end_of_word is True)
+        self.score = None
+        
+        # Up to cache_size (-score, word) pairs from this subtree, best first
+        self.best = []
+
+
+class WeightedTrie(Trie):
+    """
+    Trie of scored words for top-k autocomplete
+    
+    Every node keeps the best cache_size words of its subtree, so top_k
+    only walks the prefix and slices a list: O(len(prefix) + k).
+    """
+    
+    node_class = WeightedTrieNode
+    
+    def __init__(self, cache_size=10):
+        """
+        Initialize the trie
+        
+        Args:
+            cache_size (int): Number of best words cached on every node
+                (at least 1)
+        """
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        super().__init__()
+        self.cache_size = cache_size
+    
+    def insert(self, word, score=0):
+        """
+        Insert a word with a score, or update the score of an existing word
+        
+        Args:
+            word (str): The word to insert
+            score (int or float): Higher scores are suggested first
+        """
+        node = self.root
+        path = [node]
+        for char in word:
             if char not in node.children:
-                return result
+                node.children[char] = self.node_class()
             node = node.children[char]
+            path.append(node)
+        
+        old_score = node.score if node.is_end_of_word else None
+        node.is_end_of_word = True
+        node.score = score
+        
+        if old_score is None or score >= old_score:
+            # The word can only move up: update it in place on every list
+            entry = (-score, word)
+            for node in path:
+                self._offer(node, word, old_score, entry)
+        else:
+            # The word moved down and may leave some lists; rebuild them
+            # bottom-up from the children's lists
+            for depth in range(len(word), -1, -1):
+                self._rebuild(path[depth], word[:depth])
+    
+    def _offer(self, node, word, old_score, entry):
+        """Put entry on the node's best list, replacing the word's old entry"""
+        best = node.best
+        if old_score is not None:
+            old_entry = (-old_score, word)
+            index = bisect_left(best, old_entry)
+            if index < len(best) and best[index] == old_entry:
+                del best[index]
         
-        # Use DFS to find all words starting from the prefix node
-        self._dfs(node, prefix, result)
-        return result
+        if len(best) < self.cache_size or entry < best[-1]:
+            insort(best, entry)
+            if len(best) > self.cache_size:
+                best.pop()
+    
+    def _rebuild(self, node, word):
+        """Recompute the best list of the node spelling word from its children"""
+        candidates = [child.best for child in node.children.values()]
+        if node.is_end_of_word:
+            candidates.append([(-node.score, word)])
+        node.best = list(islice(merge(*candidates), self.cache_size))
     
-    def _dfs(self, node, prefix, result):
+    def iter_top(self, prefix):
         """
-        Helper method for DFS traversal to find all words with a given prefix
+        Lazily yield the words starting with the prefix, best score first
+        
+        The cached best list of a node bounds every score below it, so a
+        heap of nodes ordered by that bound expands only as much of the
+        subtree as the caller consumes.
         
         Args:
-            node (TrieNode): Current node in the traversal
-            prefix (str): Current prefix formed by the path from root to node
-            result (list): List to store the words found
+            prefix (str): The prefix to complete
+            
+        Yields:
+            tuple: (word, score) in decreasing score order
         """
-        if node.is_end_of_word:
-            result.append(prefix)
+        node = self._find_node(prefix)
+        if node is None or not node.best:
+            return
         
-        for char, child_node in node.children.items():
-            self._dfs(child_node, prefix + char, result)
+        # Entries: (-score, word, tie breaker, node or None); a node entry is
+        # keyed by the first word it would produce. A node's path is kept as
+        # a (char, parent path) chain and only spelled out for its own word
+        counter = count()
+        heap = [(*node.best[0], next(counter), (node, None))]
+        while heap:
+            neg_score, word, _, item = heappop(heap)
+            if item is None:
+                yield word, -neg_score
+                continue
+            
+            node, path = item
+            if node.is_end_of_word:
+                heappush(heap, (-node.score, self._spell(prefix, path), next(counter), None))
+            for char, child in node.children.items():
+                if child.best:
+                    heappush(heap, (*child.best[0], next(counter), (child, (char, path))))
+    
+    @staticmethod
+    def _spell(prefix, path):
+        """Turn a (char, parent path) chain below the prefix into a word"""
+        chars = []
+        while path is not None:
+            char, path = path
+            chars.append(char)
+        return prefix + "".join(reversed(chars))
+    
+    def top_k(self, prefix, k):
+        """
+        Get the k best-scoring words that start with the prefix
+        
+        Args:
+            prefix (str): The prefix to complete
+            k (int): Number of suggestions
+            
+        Returns:
+            list: Up to k (word, score) pairs, best first
+        """
+        if k <= 0:
+            return []
+        if k <= self.cache_size:
+            node = self._find_node(prefix)
+            if node is None:
+                return []
+            return [(word, -neg_score) for neg_score, word in node.best[:k]]
+        
+        return list(islice(self.iter_top(prefix), k))
 
 
 # Example usage
@@ -173,3 +364,10 @@ if __name__ == "__main__":
     # Get words with prefix
     print(f"Words with prefix 'app': {trie.get_words_with_prefix('app')}")  # ['apple', 'app', 'application']
     print(f"Words with prefix 'ba': {trie.get_words_with_prefix('ba')}")  # ['banana', 'ball', 'bat']
+    
+    # Weighted autocomplete
+    weighted = WeightedTrie(cache_size=3)
+    for word, score in [("apple", 5), ("app", 9), ("application", 7), ("apply", 3), ("banana", 4)]:
+        weighted.insert(word, score)
+    print(f"Top 2 for 'app': {weighted.top_k('app', 2)}")  # [('app', 9), ('application', 7)]
+    print(f"Top 5 for 'ap': {weighted.top_k('ap', 5)}")  # served lazily beyond the cache
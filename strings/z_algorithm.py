@@ -8,9 +8,10 @@ length of the pattern.
 The Z-Algorithm works by calculating a Z-array for a string, where Z[i] represents the
 length of the longest substring starting at position i that is also a prefix of the string.
 
-For pattern matching, we concatenate the pattern, a special character (that doesn't appear
-in the text or pattern), and the text, then compute the Z-array for this concatenated string.
-The positions where Z[i] equals the pattern length indicate matches.
+For pattern matching, the classic approach concatenates the pattern, a separator and the
+text, and reports the positions where Z[i] equals the pattern length. Here the Z-array of
+the pattern alone is computed once and the text is scanned against it, which avoids copying
+the text and works no matter which characters the text contains.
 
 Operations to implement:
 1. Compute the Z-array for a given string
@@ -23,6 +24,8 @@ Applications:
 - Palindrome detection
 """
 
+from strings.palindromes import longest_palindromic_substring
+
 def compute_z_array(string):
     """
     Compute the Z-array for a given string
@@ -78,6 +81,97 @@ def compute_z_array(string):
     return z
 
 
+class ZMatcher:
+    """
+    Z-algorithm matcher that never concatenates the pattern and the text
+
+    The Z-array of the pattern is computed once. Each text is then scanned
+    with the "extended Z" recurrence: for every text position i it finds
+    the length of the longest common prefix of text[i:] and the pattern,
+    reusing the rightmost window text[l:r] == pattern[:r - l] exactly like
+    compute_z_array does. No separator is needed, so any character may
+    appear in the text, and str, bytes, bytearray and memoryview texts are
+    read in place without copying.
+    """
+
+    def __init__(self, pattern):
+        """
+        Preprocess the pattern
+
+        Args:
+            pattern (str or bytes-like): The pattern to search for
+        """
+        if not len(pattern):
+            raise ValueError("pattern must be non-empty")
+
+        self.pattern = pattern
+        self.is_str = isinstance(pattern, str)
+        self.z = compute_z_array(pattern)
+        self.z[0] = len(pattern)
+
+    def finditer(self, text):
+        """
+        Lazily yield the start offsets of all matches
+
+        Args:
+            text (str or bytes-like): The text to search in
+
+        Yields:
+            int: Start offset of each match
+        """
+        if isinstance(text, str) != self.is_str:
+            raise TypeError("pattern and text must both be str or both be bytes-like")
+
+        pattern = self.pattern
+        z = self.z
+        m = len(pattern)
+        n = len(text)
+
+        # [left, right) is the rightmost window with text[left:right] == pattern[:right - left]
+        left = right = 0
+        for i in range(n):
+            if i < right:
+                known = z[i - left]
+                if known < right - i:
+                    # The match at i ends strictly inside the window
+                    continue
+                length = right - i
+            else:
+                length = 0
+
+            # Extend the match past the window one character at a time
+            while length < m and i + length < n and text[i + length] == pattern[length]:
+                length += 1
+
+            left, right = i, i + length
+            if length == m:
+                yield i
+
+    def search(self, text):
+        """
+        Find all occurrences of the pattern
+
+        Args:
+            text (str or bytes-like): The text to search in
+
+        Returns:
+            list: Indices where the pattern occurs in the text
+        """
+        return list(self.finditer(text))
+
+    def search_many(self, texts):
+        """
+        Match the pattern against many texts, reusing its Z-array
+
+        Args:
+            texts (iterable): The texts to search in
+
+        Returns:
+            list: One list of match indices per text
+        """
+        return [self.search(text) for text in texts]
+
+
 def z_algorithm_pattern_matching(text, pattern):
     """
     Find all occurrences of a pattern in a text using the Z-Algorithm
@@ -89,30 +183,30 @@ def z_algorithm_pattern_matching(text, pattern):
     Returns:
         list: Indices where the pattern occurs in the text
     """
-    # Concatenate pattern, a special character, and text
-    # The special character should not appear in either the pattern or text
-    # For simplicity, we use '$' as the special character
-    concatenated = pattern + "$" + text
-    
-    # Compute the Z-array for the concatenated string
-    z = compute_z_array(concatenated)
-    
-    # Find all occurrences of the pattern in the text
-    pattern_length = len(pattern)
-    result = []
-    
-    # Check Z-values starting from the position after the special character
-    for i in range(pattern_length + 1, len(concatenated)):
-        if z[i] == pattern_length:
-            # Found a match at position i - (pattern_length + 1) in the original text
-            result.append(i - (pattern_length + 1))
+    return ZMatcher(pattern).search(text)
+
+
+def z_search_many(pattern, texts):
+    """
+    Find all occurrences of one pattern in each of many texts
     
-    return result
+    Args:
+        pattern (str or bytes-like): The pattern to search for
+        texts (iterable): The texts to search in
+        
+    Returns:
+        list: One list of match indices per text
+    """
+    return ZMatcher(pattern).search_many(texts)
 
 
 def find_longest_palindromic_substring(string):
     """
-    Find the longest palindromic substring in a given string using the Z-Algorithm
+    Find the longest palindromic substring in a given string
+    
+    Matching the string against its reverse with the Z-array only finds
+    palindromes anchored at particular positions (it fails on "xabay"),
+    so this delegates to Manacher's algorithm in strings.palindromes.
     
     Args:
         string (str): The input string
@@ -120,35 +214,7 @@ def find_longest_palindromic_substring(string):
     Returns:
         str: The longest palindromic substring
     """
-    # Create a new string by concatenating the original string,
-    # a special character, and the reversed string
-    reversed_string = string[::-1]
-    concatenated = string + "$" + reversed_string
-    
-    # Compute the Z-array for the concatenated string
-    z = compute_z_array(concatenated)
-    
-    # Find the maximum Z-value and its position
-    max_z = 0
-    max_z_index = 0
-    
-    for i in range(len(string) + 1, len(concatenated)):
-        # Check if the current Z-value is greater than the maximum
-        if z[i] > max_z:
-            # Make sure the palindrome doesn't overlap with the reversed part
-            # The palindrome should be contained entirely within the original string
-            if i + z[i] <= 2 * len(string) + 1:
-                max_z = z[i]
-                max_z_index = i
-    
-    # Extract the longest palindromic substring
-    if max_z == 0:
-        return string[0]  # Return the first character if no palindrome is found
-    
-    # Calculate the starting position of the palindrome in the original string
-    start = len(string) - (max_z_index - len(string) - 1) - max_z
-    
-    return string[start:start + max_z]
+    return longest_palindromic_substring(string)
 
 
 # Example usage
@@ -164,6 +230,10 @@ if __name__ == "__main__":
     else:
         print(f"Pattern '{pattern}' not found in the text")
     
+    # One pattern against many texts, including '$' and bytes buffers
+    texts = [b"AB$AB", bytearray(b"xxABx"), memoryview(b"ABAB")]
+    print(f"Matches of b'AB' in each text: {z_search_many(b'AB', texts)}")
+    
     # Test the Z-array computation
     test_string = "aabcaabxaaaz"
     z_array = compute_z_array(test_string)
@@ -171,7 +241,7 @@ if __name__ == "__main__":
     print(f"Z-array: {z_array}")
     
     # Test finding the longest palindromic substring
-    test_strings = ["babad", "cbbd", "racecar", "banana"]
+    test_strings = ["babad", "cbbd", "racecar", "banana", "xabay"]
     for s in test_strings:
         longest_palindrome = find_longest_palindromic_substring(s)
         print(f"Longest palindromic substring in '{s}': '{longest_palindrome}'")